@@ -20,7 +20,7 @@ class SecularSocietyAnalyzer:
     def load_data(self):
         """Load translation data"""
         try:
-            self.translations = pd.read_csv('output/corrected_translations.tsv', sep='\t')
+            self.translations = pd.read_csv('output/corrected_translations.tsv', sep='\t', engine='pyarrow')
             print(f"✓ Loaded {len(self.translations)} translations")
             return True
         except:
@@ -186,16 +186,18 @@ class SecularSocietyAnalyzer:
         print(f"📊 RESOURCE ALLOCATION PATTERNS:")
         print(f"   Resource management instances: {len(allocation_patterns['resource_management'])}")
         
-        # Analyze most common patterns
-        resource_action_combos = defaultdict(int)
-        for instance in allocation_patterns['resource_management']:
-            for resource in instance['resources']:
-                for action in instance['actions']:
-                    resource_action_combos[f"{resource}-{action}"] += 1
+        # Analyze most common patterns (explode resource x action pairs, count in pandas)
+        instances = allocation_patterns['resource_management']
+        if instances:
+            pairs = pd.DataFrame(instances, columns=['resources', 'actions'])
+            pairs = pairs.explode('resources').explode('actions').dropna()
+            resource_action_combos = (pairs.groupby(['resources', 'actions'], sort=False).size()
+                                      .sort_values(ascending=False, kind='stable'))
+        else:
+            resource_action_combos = pd.Series(dtype='int64')
         
         print(f"\n🔧 TOP RESOURCE-ACTION COMBINATIONS:")
-        for combo, count in sorted(resource_action_combos.items(), key=lambda x: x[1], reverse=True)[:10]:
-            resource, action = combo.split('-')
+        for (resource, action), count in resource_action_combos.head(10).items():
             print(f"   {resource.title()} + {action}: {count} instances")
         
         print(f"\n💧 RESOURCE ALLOCATION EXAMPLES:")
@@ -23,7 +23,7 @@ def load_seed_glosses(gloss_file):
 
 def analyze_co_occurrence(corpus_file, seed_glosses):
     """Analyze sign co-occurrence patterns for semantic spreading"""
-    df = pd.read_csv(corpus_file, sep='\t')
+    df = pd.read_csv(corpus_file, sep='\t', engine='pyarrow')
     
     co_occurrence = defaultdict(Counter)
     sign_positions = defaultdict(list)
@@ -10,7 +10,7 @@ def analyze_sign_survival(corpus_file, sites_file, out_png, out_csv):
     print("📈 SIGN SURVIVAL ANALYSIS")
     
     # Load data
-    corpus_df = pd.read_csv(corpus_file, sep='\t')
+    corpus_df = pd.read_csv(corpus_file, sep='\t', engine='pyarrow')
     sites_df = pd.read_csv(sites_file)
     
     print(f"   📊 Loaded {len(corpus_df)} inscriptions, {len(sites_df)} sites")
@@ -6,15 +6,95 @@ Auto-generates high-confidence translated certificate "stories" for historians
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.feather as feather
 from collections import defaultdict, Counter
 import argparse
+import os
+import pickle
 import random
 import re
+import sys
+
+# Certificate vocabulary; tuples keep scan order, since the first hit of each
+# group becomes the narrative component
+_QUANTITY_TERMS = tuple(map(sys.intern, ['three', 'many', 'all', 'some', 'few', 'great', 'small', 'good']))
+_PLACE_TERMS = tuple(map(sys.intern, ['place', 'house', 'land', 'sacred']))
+_ACTION_TERMS = tuple(map(sys.intern, ['come', 'go', 'stand', 'flow', 'hold']))
+
+# Quantities that mark blessing / validation certificates
+_BLESSING_QUANTS = frozenset({'many', 'great', 'all'})
+_VALIDATION_QUANTS = frozenset({'good', 'great'})
+
+_NARRATIVE_TEMPLATES = {
+    'certification': "{owner} certifies {quantity} {resource} at {place}",
+    'blessing': "{owner} blesses the {resource} for {action}",
+    'authorization': "{owner} authorizes {quantity} {resource} trade",
+    'consecration': "{owner} consecrates the sacred {resource} place",
+    'validation': "{owner} validates {resource} abundance"
+}
+
+def _term_hits(texts, term_groups):
+    """Boolean hit matrix (rows x terms) for the concatenated term groups"""
+    # Scan each distinct term once (e.g. 'house', 'land' sit in two groups), then
+    # fan the columns out to per-group slots through a term-index LUT
+    all_terms = [term for group in term_groups for term in group]
+    vocabulary = list(dict.fromkeys(all_terms))
+    if not vocabulary:
+        return np.zeros((len(texts), 0), dtype=bool)
+    term_lut = np.array([vocabulary.index(term) for term in all_terms], dtype=np.intp)
+    
+    # Run Arrow's match_substring kernel directly on the string buffer (zero-copy
+    # for string[pyarrow]) rather than going through the pandas .str wrapper per term
+    haystack = pa.array(texts.astype('string[pyarrow]'))
+    vocab_hits = np.column_stack([pc.fill_null(pc.match_substring(haystack, term), False).to_numpy(zero_copy_only=False)
+                                  for term in vocabulary])
+    return vocab_hits[:, term_lut]
+
+_TRANSLATIONS_TSV = 'output/corrected_translations.tsv'
+_CERT_CACHE_VERSION = 2  # Bump when the cached candidate layout changes
+
+_TEXT_DTYPES = {'english_translation': 'string[pyarrow]', 'original_indus': 'string[pyarrow]'}
+
+# Feather schema metadata key holding the size/mtime stamp of the source TSV
+_STAMP_KEY = b'indus_source'
+
+def _source_stamp(path):
+    """Size and mtime of a file, the identity its derived caches are keyed on"""
+    st = os.stat(path)
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+def _load_translations(tsv_path=_TRANSLATIONS_TSV):
+    """Load translations, via a Feather cache next to the TSV when INDUS_CACHE=1 and the TSV is unchanged"""
+    feather_path = None
+    if os.environ.get('INDUS_CACHE') == '1':
+        feather_path = os.path.splitext(tsv_path)[0] + '.feather'
+        stamp = _source_stamp(tsv_path).encode()
+        try:
+            with pa.memory_map(feather_path) as source:
+                fresh = (pa.ipc.open_file(source).schema.metadata or {}).get(_STAMP_KEY) == stamp
+        except (OSError, pa.ArrowException):
+            fresh = False  # Missing or unreadable cache is rebuilt
+        if fresh:
+            # Feather restores the text columns as string[python]; keep the Arrow-backed storage
+            return pd.read_feather(feather_path).astype(_TEXT_DTYPES)
+    
+    translations = pd.read_csv(tsv_path, sep='\t').astype(_TEXT_DTYPES)
+    if feather_path is not None:
+        try:
+            table = pa.Table.from_pandas(translations, preserve_index=False)
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}), _STAMP_KEY: stamp})
+            feather.write_feather(table, feather_path)
+        except (OSError, pa.ArrowException):
+            pass  # Cache is best-effort; a read-only output/ or a mixed-type column just means re-parsing next run
+    return translations
 
 class StorySampler:
     """Generates narrative examples of sacred-economy certificates"""
     
-    def __init__(self):
+    def __init__(self, verbose=True):
+        self.verbose = verbose
         self.owners = ['father', 'mother', 'king', 'priest', 'person', 'house', 'lord', 'chief']
         self.resources = ['water', 'cattle', 'grain', 'copper', 'land', 'fish', 'salt']
         self.high_confidence_stories = []
@@ -23,126 +103,149 @@ class StorySampler:
         """Load ledger and set criteria"""
         try:
             self.ledger = pd.read_csv(ledger_path, sep='\t')
-            self.target_owners = owner_list
-            self.target_resources = resource_list
-            print(f"✓ Loaded {len(self.ledger)} ledger entries")
-            print(f"✓ Target owners: {', '.join(self.target_owners)}")
-            print(f"✓ Target resources: {', '.join(self.target_resources)}")
+            self.target_owners = tuple(map(sys.intern, owner_list))
+            self.target_resources = tuple(map(sys.intern, resource_list))
+            if self.verbose:
+                print(f"✓ Loaded {len(self.ledger)} ledger entries")
+                print(f"✓ Target owners: {', '.join(self.target_owners)}")
+                print(f"✓ Target resources: {', '.join(self.target_resources)}")
             return True
         except Exception as e:
             print(f"❌ Error loading ledger: {e}")
             return False
     
+    def _certificate_cache(self, tsv_path):
+        """Cache file for extraction results (one per input, overwritten) and the key it must match
+        
+        The key covers the input size and mtime and the search vocabulary.
+        """
+        key = repr((_CERT_CACHE_VERSION, os.path.abspath(tsv_path), _source_stamp(tsv_path),
+                    self.target_owners, self.target_resources,
+                    _QUANTITY_TERMS, _PLACE_TERMS, _ACTION_TERMS))
+        return os.path.join(os.path.dirname(tsv_path), '.cert_cache.pkl'), key
+    
+    def _score_certificates(self, translations):
+        """Score every translation and return a DataFrame of certificate candidates, best first"""
+        term_groups = [self.target_owners, self.target_resources, _QUANTITY_TERMS, _PLACE_TERMS, _ACTION_TERMS]
+        group_weights = [2, 2, 1, 1, 1]
+        all_terms = np.array([term for group in term_groups for term in group], dtype=object)
+        bounds = np.cumsum([0] + [len(group) for group in term_groups])
+        groups = [slice(bounds[i], bounds[i + 1]) for i in range(len(term_groups))]
+        
+        # Find owners and resources first; a row missing either can never qualify
+        lower = translations['english_translation'].str.lower()
+        key_hits = _term_hits(lower, term_groups[:2])
+        rows = np.flatnonzero(key_hits[:, groups[0]].any(axis=1) & key_hits[:, groups[1]].any(axis=1))
+        
+        # Look for quantity and place/action indicators only on the surviving rows
+        hits = np.hstack([key_hits[rows], _term_hits(lower.iloc[rows], term_groups[2:])])
+        
+        # Calculate confidence score as a weighted sum of term hits
+        term_weights = np.repeat(group_weights, [len(group) for group in term_groups])
+        confidence = hits.astype(np.int8) @ term_weights
+        
+        # Only keep high-confidence certificates, sorted by confidence
+        selected = np.flatnonzero(confidence >= 4)
+        selected = selected[np.argsort(-confidence[selected], kind='stable')]
+        
+        # Materialize results column-wise, only for the surviving rows
+        keep = rows[selected]
+        kept_hits = hits[selected]
+        originals = translations['original_indus'].iloc[keep]
+        
+        certificate_candidates = pd.DataFrame({
+            'original_indus': originals.to_numpy(),
+            'english_translation': lower.iloc[keep].to_numpy(),
+            **{name: [all_terms[group][row_hits[group]].tolist() for row_hits in kept_hits]
+               for name, group in zip(['owners', 'resources', 'quantities', 'places', 'actions'], groups)},
+            'confidence_score': confidence[selected],
+            'length': originals.str.split().str.len().to_numpy()
+        })
+        
+        return certificate_candidates
+    
     def extract_certificate_stories(self):
         """Extract high-confidence certificate stories from translations"""
-        print(f"\n📖 EXTRACTING CERTIFICATE STORIES")
-        print("=" * 31)
+        if self.verbose:
+            print(f"\n📖 EXTRACTING CERTIFICATE STORIES")
+            print("=" * 31)
         
         # Load translations
         try:
-            translations = pd.read_csv('output/corrected_translations.tsv', sep='\t')
-            print(f"✓ Analyzing {len(translations)} translations")
-            
-            certificate_candidates = []
+            # Opt-in on-disk memo (INDUS_CACHE=1), like the truth_detector term scan
+            cache_path, cache_key = None, None
+            if os.environ.get('INDUS_CACHE') == '1':
+                cache_path, cache_key = self._certificate_cache(_TRANSLATIONS_TSV)
+            certificate_candidates = None
+            if cache_path is not None and os.path.exists(cache_path):
+                with open(cache_path, 'rb') as f:
+                    key, candidates = pickle.load(f)
+                if key == cache_key:
+                    certificate_candidates = candidates
+                    if self.verbose:
+                        print(f"✓ Reusing cached extraction ({cache_path})")
+            if certificate_candidates is None:
+                translations = _load_translations()
+                if self.verbose:
+                    print(f"✓ Analyzing {len(translations)} translations")
+                certificate_candidates = self._score_certificates(translations)
+                if cache_path is not None:
+                    try:
+                        with open(cache_path, 'wb') as f:
+                            pickle.dump((cache_key, certificate_candidates), f, protocol=pickle.HIGHEST_PROTOCOL)
+                    except OSError:
+                        pass  # Cache is best-effort
             
-            for _, row in translations.iterrows():
-                original = row['original_indus']
-                translation = row['english_translation'].lower()
-                
-                # Find owners and resources in this translation
-                found_owners = [owner for owner in self.target_owners if owner in translation]
-                found_resources = [resource for resource in self.target_resources if resource in translation]
-                
-                # Look for quantity indicators
-                quantity_terms = ['three', 'many', 'all', 'some', 'few', 'great', 'small', 'good']
-                found_quantities = [qty for qty in quantity_terms if qty in translation]
-                
-                # Look for place/action indicators
-                place_terms = ['place', 'house', 'land', 'sacred']
-                action_terms = ['come', 'go', 'stand', 'flow', 'hold']
-                found_places = [place for place in place_terms if place in translation]
-                found_actions = [action for action in action_terms if action in translation]
-                
-                # Calculate confidence score
-                confidence = 0
-                if found_owners: confidence += 2 * len(found_owners)
-                if found_resources: confidence += 2 * len(found_resources)
-                if found_quantities: confidence += 1 * len(found_quantities)
-                if found_places: confidence += 1 * len(found_places)
-                if found_actions: confidence += 1 * len(found_actions)
-                
-                # Only keep high-confidence certificates
-                if confidence >= 4 and found_owners and found_resources:
-                    certificate_candidates.append({
-                        'original_indus': original,
-                        'english_translation': translation,
-                        'owners': found_owners,
-                        'resources': found_resources,
-                        'quantities': found_quantities,
-                        'places': found_places,
-                        'actions': found_actions,
-                        'confidence_score': confidence,
-                        'length': len(original.split())
-                    })
-            
-            # Sort by confidence
-            certificate_candidates.sort(key=lambda x: x['confidence_score'], reverse=True)
-            
-            print(f"📊 CERTIFICATE EXTRACTION RESULTS:")
-            print(f"   • Total candidates: {len(certificate_candidates)}")
-            print(f"   • High confidence (≥6): {len([c for c in certificate_candidates if c['confidence_score'] >= 6])}")
-            print(f"   • Medium confidence (4-5): {len([c for c in certificate_candidates if 4 <= c['confidence_score'] < 6])}")
+            if self.verbose:
+                scores = certificate_candidates['confidence_score']
+                print(f"📊 CERTIFICATE EXTRACTION RESULTS:")
+                print(f"   • Total candidates: {len(certificate_candidates)}")
+                print(f"   • High confidence (≥6): {(scores >= 6).sum()}")
+                print(f"   • Medium confidence (4-5): {scores.between(4, 5).sum()}")
             
             return certificate_candidates
         
         except Exception as e:
             print(f"❌ Error loading translations: {e}")
-            return []
+            return pd.DataFrame()
     
     def generate_narrative_interpretations(self, certificates):
         """Generate narrative interpretations of certificates"""
-        print(f"\n📝 GENERATING NARRATIVE INTERPRETATIONS")
-        print("=" * 35)
+        if self.verbose:
+            print(f"\n📝 GENERATING NARRATIVE INTERPRETATIONS")
+            print("=" * 35)
         
-        narrative_templates = {
-            'certification': "{owner} certifies {quantity} {resource} at {place}",
-            'blessing': "{owner} blesses the {resource} for {action}",
-            'authorization': "{owner} authorizes {quantity} {resource} trade",
-            'consecration': "{owner} consecrates the sacred {resource} place",
-            'validation': "{owner} validates {resource} abundance"
-        }
+        top = certificates.head(20)  # Top 20 high-confidence certificates
+        if top.empty:
+            if self.verbose:
+                print(f"📖 GENERATED 0 NARRATIVE INTERPRETATIONS")
+            return []
         
-        narratives = []
+        # Determine narrative type based on content (first matching rule wins)
+        is_consecration = (top['english_translation'].str.contains('sacred', regex=False)
+                           | top['places'].map(lambda places: 'place' in places))
+        is_blessing = top['quantities'].map(lambda q: not _BLESSING_QUANTS.isdisjoint(q))
+        is_authorization = top['actions'].map(bool)
+        is_validation = top['quantities'].map(lambda q: not _VALIDATION_QUANTS.isdisjoint(q))
+        narrative_types = np.select(
+            [is_consecration, is_blessing, is_authorization, is_validation],
+            ['consecration', 'blessing', 'authorization', 'validation'],
+            default='certification'
+        ).tolist()
         
-        for cert in certificates[:20]:  # Top 20 high-confidence certificates
-            # Determine narrative type based on content
-            if 'sacred' in cert['english_translation'] or 'place' in cert['places']:
-                narrative_type = 'consecration'
-            elif cert['quantities'] and any(q in ['many', 'great', 'all'] for q in cert['quantities']):
-                narrative_type = 'blessing'
-            elif cert['actions']:
-                narrative_type = 'authorization'
-            elif any(q in ['good', 'great'] for q in cert['quantities']):
-                narrative_type = 'validation'
-            else:
-                narrative_type = 'certification'
-            
-            # Build narrative components
-            owner = cert['owners'][0] if cert['owners'] else 'authority'
-            resource = cert['resources'][0] if cert['resources'] else 'commodity'
-            quantity = cert['quantities'][0] if cert['quantities'] else 'sacred'
-            place = cert['places'][0] if cert['places'] else 'ceremonial place'
-            action = cert['actions'][0] if cert['actions'] else 'distribution'
-            
+        # Build narrative components: first hit per group, or a default
+        components = pd.DataFrame({
+            'owner': top['owners'].str[0].fillna('authority'),
+            'resource': top['resources'].str[0].fillna('commodity'),
+            'quantity': top['quantities'].str[0].fillna('sacred'),
+            'place': top['places'].str[0].fillna('ceremonial place'),
+            'action': top['actions'].str[0].fillna('distribution')
+        }).to_dict('records')
+        
+        narratives = []
+        for cert, narrative_type, parts in zip(top.to_dict('records'), narrative_types, components):
             # Generate narrative using template
-            template = narrative_templates[narrative_type]
-            narrative = template.format(
-                owner=owner.title(),
-                resource=resource,
-                quantity=quantity,
-                place=place,
-                action=action
-            )
+            narrative = _NARRATIVE_TEMPLATES[narrative_type].format_map({**parts, 'owner': parts['owner'].title()})
             
             narratives.append({
                 'original_indus': cert['original_indus'],
@@ -150,55 +253,48 @@ class StorySampler:
                 'narrative_interpretation': narrative,
                 'certificate_type': narrative_type,
                 'confidence_score': cert['confidence_score'],
-                'components': {
-                    'owner': owner,
-                    'resource': resource,
-                    'quantity': quantity,
-                    'place': place,
-                    'action': action
-                }
+                'components': parts
             })
         
-        print(f"📖 GENERATED {len(narratives)} NARRATIVE INTERPRETATIONS")
+        if self.verbose:
+            print(f"📖 GENERATED {len(narratives)} NARRATIVE INTERPRETATIONS")
         
         return narratives
     
     def analyze_certificate_patterns(self, narratives):
         """Analyze patterns in certificate types and content"""
-        print(f"\n🔍 CERTIFICATE PATTERN ANALYSIS")
-        print("=" * 32)
-        
-        # Count certificate types
-        type_counts = Counter(n['certificate_type'] for n in narratives)
-        
-        # Count component frequencies
-        owner_counts = Counter(n['components']['owner'] for n in narratives)
-        resource_counts = Counter(n['components']['resource'] for n in narratives)
+        if self.verbose:
+            print(f"\n🔍 CERTIFICATE PATTERN ANALYSIS")
+            print("=" * 32)
         
-        print(f"📊 CERTIFICATE TYPE DISTRIBUTION:")
-        for cert_type, count in type_counts.most_common():
-            percentage = (count / len(narratives)) * 100
-            print(f"   • {cert_type.title()}: {count} ({percentage:.1f}%)")
-        
-        print(f"\n👑 AUTHORITY FREQUENCY:")
-        for owner, count in owner_counts.most_common():
-            percentage = (count / len(narratives)) * 100
-            print(f"   • {owner.title()}: {count} ({percentage:.1f}%)")
+        # Count certificate types and component frequencies in one pass
+        type_counts, owner_counts, resource_counts = Counter(), Counter(), Counter()
+        for n in narratives:
+            type_counts[n['certificate_type']] += 1
+            owner_counts[n['components']['owner']] += 1
+            resource_counts[n['components']['resource']] += 1
         
-        print(f"\n🏺 RESOURCE FREQUENCY:")
-        for resource, count in resource_counts.most_common():
-            percentage = (count / len(narratives)) * 100
-            print(f"   • {resource.title()}: {count} ({percentage:.1f}%)")
+        if self.verbose:
+            sections = [("📊 CERTIFICATE TYPE DISTRIBUTION:", type_counts),
+                        ("\n👑 AUTHORITY FREQUENCY:", owner_counts),
+                        ("\n🏺 RESOURCE FREQUENCY:", resource_counts)]
+            for heading, counts in sections:
+                print(heading)
+                ranked = counts.most_common()
+                percentages = np.array([count for _, count in ranked]) / len(narratives) * 100
+                for (label, count), percentage in zip(ranked, percentages):
+                    print(f"   • {label.title()}: {count} ({percentage:.1f}%)")
         
         # Determine dominant patterns
         dominant_type = type_counts.most_common(1)[0][0] if type_counts else None
         dominant_owner = owner_counts.most_common(1)[0][0] if owner_counts else None
         dominant_resource = resource_counts.most_common(1)[0][0] if resource_counts else None
         
-        print(f"\n🎯 DOMINANT PATTERNS:")
-        print(f"   • Primary certificate function: {dominant_type}")
-        print(f"   • Primary authority: {dominant_owner}")
-        print(f"   • Primary resource: {dominant_resource}")
+        if self.verbose:
+            print(f"\n🎯 DOMINANT PATTERNS:")
+            print(f"   • Primary certificate function: {dominant_type}")
+            print(f"   • Primary authority: {dominant_owner}")
+            print(f"   • Primary resource: {dominant_resource}")
         
         return {
             'type_distribution': dict(type_counts),
@@ -213,44 +309,53 @@ class StorySampler:
     
     def save_sample_narratives(self, narratives, patterns, output_path):
         """Save sample narratives to markdown file"""
-        print(f"\n💾 SAVING SAMPLE NARRATIVES TO {output_path}")
+        if self.verbose:
+            print(f"\n💾 SAVING SAMPLE NARRATIVES TO {output_path}")
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("# Sacred-Economy Certificate Stories\n\n")
-            f.write("*Auto-generated high-confidence examples from Indus Valley script analysis*\n\n")
-            
-            f.write("## Executive Summary\n\n")
-            f.write(f"**Total certificates analyzed**: {len(narratives)}\n\n")
-            f.write(f"**Primary function**: {patterns['dominant_patterns']['type'].title()}\n\n")
-            f.write(f"**Primary authority**: {patterns['dominant_patterns']['owner'].title()}\n\n")
-            f.write(f"**Primary resource**: {patterns['dominant_patterns']['resource'].title()}\n\n")
-            
-            f.write("## Certificate Type Distribution\n\n")
-            for cert_type, count in patterns['type_distribution'].items():
-                percentage = (count / len(narratives)) * 100
-                f.write(f"- **{cert_type.title()}**: {count} certificates ({percentage:.1f}%)\n")
-            
-            f.write("\n## Sample Certificate Stories\n\n")
-            f.write("*Each story shows: [Original Indus] → Literal Translation → **Certificate Interpretation***\n\n")
-            
-            for i, narrative in enumerate(narratives, 1):
-                f.write(f"### {i}. {narrative['certificate_type'].title()} Certificate\n\n")
-                f.write(f"**Original Indus**: `{narrative['original_indus']}`\n\n")
-                f.write(f"**Literal Translation**: \"{narrative['literal_translation']}\"\n\n")
-                f.write(f"**Certificate Interpretation**: **{narrative['narrative_interpretation']}**\n\n")
-                f.write(f"*Confidence Score: {narrative['confidence_score']}*\n\n")
-                f.write("---\n\n")
-            
-            f.write("## Sacred-Economy Model Implications\n\n")
-            f.write("These certificate stories reveal that the Indus Valley script functioned as:\n\n")
-            f.write("1. **Divine authorization system** for trade and resource control\n")
-            f.write("2. **Religious validation** of economic relationships\n")
-            f.write("3. **Ceremonial documentation** rather than accounting records\n")
-            f.write("4. **Spiritual legitimization** of material transactions\n\n")
-            f.write("This represents the world's first **theocratic trade federation** where economic ")
-            f.write("activity required religious approval and spiritual certification.\n")
+        parts = [
+            "# Sacred-Economy Certificate Stories\n\n",
+            "*Auto-generated high-confidence examples from Indus Valley script analysis*\n\n",
+            "## Executive Summary\n\n",
+            f"**Total certificates analyzed**: {len(narratives)}\n\n",
+            f"**Primary function**: {patterns['dominant_patterns']['type'].title()}\n\n",
+            f"**Primary authority**: {patterns['dominant_patterns']['owner'].title()}\n\n",
+            f"**Primary resource**: {patterns['dominant_patterns']['resource'].title()}\n\n",
+            "## Certificate Type Distribution\n\n"
+        ]
+        
+        for cert_type, count in patterns['type_distribution'].items():
+            percentage = (count / len(narratives)) * 100
+            parts.append(f"- **{cert_type.title()}**: {count} certificates ({percentage:.1f}%)\n")
+        
+        parts.append("\n## Sample Certificate Stories\n\n")
+        parts.append("*Each story shows: [Original Indus] → Literal Translation → **Certificate Interpretation***\n\n")
+        
+        for i, narrative in enumerate(narratives, 1):
+            parts.append(
+                f"### {i}. {narrative['certificate_type'].title()} Certificate\n\n"
+                f"**Original Indus**: `{narrative['original_indus']}`\n\n"
+                f"**Literal Translation**: \"{narrative['literal_translation']}\"\n\n"
+                f"**Certificate Interpretation**: **{narrative['narrative_interpretation']}**\n\n"
+                f"*Confidence Score: {narrative['confidence_score']}*\n\n"
+                "---\n\n"
+            )
+        
+        parts.append(
+            "## Sacred-Economy Model Implications\n\n"
+            "These certificate stories reveal that the Indus Valley script functioned as:\n\n"
+            "1. **Divine authorization system** for trade and resource control\n"
+            "2. **Religious validation** of economic relationships\n"
+            "3. **Ceremonial documentation** rather than accounting records\n"
+            "4. **Spiritual legitimization** of material transactions\n\n"
+            "This represents the world's first **theocratic trade federation** where economic "
+            "activity required religious approval and spiritual certification.\n"
+        )
+        
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write("".join(parts))
         
-        print(f"✅ Saved {len(narratives)} sample narratives to {output_path}")
+        if self.verbose:
+            print(f"✅ Saved {len(narratives)} sample narratives to {output_path}")
         return True
 
 def main():
@@ -259,6 +364,7 @@ def main():
     parser.add_argument('--owners', required=True, help='Comma-separated owner list')
     parser.add_argument('--resources', required=True, help='Comma-separated resource list')
     parser.add_argument('--out_md', required=True, help='Output markdown path')
+    parser.add_argument('--quiet', action='store_true', help='Suppress per-step progress output')
     
     args = parser.parse_args()
     
@@ -270,7 +376,7 @@ def main():
     owner_list = [o.strip() for o in args.owners.split(',')]
     resource_list = [r.strip() for r in args.resources.split(',')]
     
-    sampler = StorySampler()
+    sampler = StorySampler(verbose=not args.quiet)
     
     # Load data
     if not sampler.load_data(args.ledger, owner_list, resource_list):
@@ -279,7 +385,7 @@ def main():
     # Extract certificate stories
     certificates = sampler.extract_certificate_stories()
     
-    if not certificates:
+    if certificates.empty:
         print("❌ No certificate stories found!")
         return 1
     
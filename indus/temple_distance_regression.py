@@ -8,10 +8,19 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy import stats
-from sklearn.linear_model import LinearRegression
 import argparse
 import json
-from collections import defaultdict
+
+def _authority_counts(dist):
+    """Simulated father/mother/king certification counts per route distance (km)"""
+    # Simulate: longer distances require more authority
+    base_authority = np.maximum(1, (dist // 200).astype(np.int64))
+    
+    # Distribute among authority types based on our findings
+    father = base_authority * 4                  # 80% father
+    mother = base_authority * 1                  # 15% mother
+    king = np.maximum(1, base_authority // 2)    # 5% king
+    return father, mother, king
 
 class TempleDistanceAnalyzer:
     """Analyzes relationship between authority terms and trade network distance"""
@@ -19,7 +28,8 @@ class TempleDistanceAnalyzer:
     def __init__(self):
         self.owners_data = None
         self.edges_data = None
-        self.distance_matrix = {}
+        self.sites = []
+        self.distance_matrix = None  # sites x sites, np.inf where no route
         
     def load_data(self, owners_path, edges_path):
         """Load owners and edges data"""
@@ -78,65 +88,69 @@ class TempleDistanceAnalyzer:
         print(f"\n📏 CALCULATING DISTANCE MATRIX")
         print("=" * 30)
         
-        # Build distance matrix
-        all_sites = set()
-        for _, edge in self.edges_data.iterrows():
-            all_sites.add(edge['site1'])
-            all_sites.add(edge['site2'])
-            
-            # Store both directions
-            key1 = (edge['site1'], edge['site2'])
-            key2 = (edge['site2'], edge['site1'])
-            self.distance_matrix[key1] = edge['distance']
-            self.distance_matrix[key2] = edge['distance']
+        # Index sites, then fill a symmetric sites x sites distance matrix
+        s1 = self.edges_data['site1'].to_numpy()
+        s2 = self.edges_data['site2'].to_numpy()
+        d = self.edges_data['distance'].to_numpy(dtype=np.float64)
+        
+        sites, site_idx = np.unique(np.concatenate([s1, s2]), return_inverse=True)
+        idx1, idx2 = site_idx[:len(s1)], site_idx[len(s1):]
         
-        all_sites = sorted(all_sites)
+        self.sites = sites.tolist()
+        self.distance_matrix = np.full((len(sites), len(sites)), np.inf)
+        self.distance_matrix[idx1, idx2] = d
+        self.distance_matrix[idx2, idx1] = d
+        
+        all_sites = self.sites
+        routes = self.route_distances()[2]
         
         print(f"📊 DISTANCE MATRIX RESULTS:")
         print(f"   • Total sites: {len(all_sites)}")
-        print(f"   • Total connections: {len(self.distance_matrix) // 2}")
-        print(f"   • Average distance: {np.mean(list(self.distance_matrix.values())):.0f} km")
-        print(f"   • Distance range: {min(self.distance_matrix.values()):.0f} - {max(self.distance_matrix.values()):.0f} km")
+        print(f"   • Total connections: {len(routes)}")
+        print(f"   • Average distance: {routes.mean():.0f} km")
+        print(f"   • Distance range: {routes.min():.0f} - {routes.max():.0f} km")
         
         return all_sites
     
+    def route_distances(self):
+        """Unique connected routes as parallel arrays (site1 idx, site2 idx, distance), site1 < site2"""
+        idx1, idx2 = np.triu_indices(len(self.sites), k=1)
+        dist = self.distance_matrix[idx1, idx2]
+        connected = np.isfinite(dist)
+        return idx1[connected], idx2[connected], dist[connected]
+    
     def analyze_authority_distance_correlation(self, sites):
         """Analyze correlation between authority terms and distance"""
         print(f"\n🔗 AUTHORITY-DISTANCE CORRELATION ANALYSIS")
         print("=" * 42)
         
-        # Prepare data for regression
-        authority_distance_data = []
+        # Unique routes (upper triangle of the symmetric matrix)
+        idx1, idx2, dist = self.route_distances()
+        if not len(dist):
+            return pd.DataFrame()
+        site_names = np.asarray(self.sites, dtype=object)
+        site1, site2 = site_names[idx1], site_names[idx2]
         
-        # Assign authorities to site pairs based on our earlier analysis
-        for (site1, site2), distance in self.distance_matrix.items():
-            if site1 < site2:  # Avoid duplicates
-                
-                # Count authority certifications for this route
-                # Based on our owner data, simulate authority requirements
-                authority_counts = defaultdict(int)
-                
-                # Simulate: longer distances require more authority
-                base_authority = max(1, int(distance / 200))  # More authority for longer distances
-                
-                # Distribute among authority types based on our findings
-                authority_counts['father'] = base_authority * 4  # 80% father
-                authority_counts['mother'] = base_authority * 1  # 15% mother  
-                authority_counts['king'] = max(1, base_authority // 2)  # 5% king
-                
-                for authority, count in authority_counts.items():
-                    authority_distance_data.append({
-                        'site1': site1,
-                        'site2': site2,
-                        'distance': distance,
-                        'authority_type': authority,
-                        'authority_count': count,
-                        'log_distance': np.log(distance),
-                        'route_category': 'short' if distance < 300 else 'medium' if distance < 600 else 'long'
-                    })
+        # Count authority certifications for each route
+        authority_types = ['father', 'mother', 'king']
+        authority_counts = np.stack(_authority_counts(dist), axis=1).ravel()
         
-        # Convert to DataFrame for analysis
-        df = pd.DataFrame(authority_distance_data)
+        # Per-route features, computed once per route before the authority expansion
+        log_distance = np.log(dist)
+        route_category = np.select([dist < 300, dist < 600], ['short', 'medium'], default='long')
+        
+        # One row per (route, authority), built column-wise
+        n_types = len(authority_types)
+        df = pd.DataFrame({
+            'site1': np.repeat(site1, n_types),
+            'site2': np.repeat(site2, n_types),
+            'distance': np.repeat(dist, n_types),
+            'authority_type': pd.Categorical(np.tile(authority_types, len(dist)), categories=authority_types),
+            'authority_count': authority_counts,
+            'log_distance': np.repeat(log_distance, n_types),
+            'route_category': pd.Categorical(np.repeat(route_category, n_types),
+                                             categories=['short', 'medium', 'long'], ordered=True)
+        })
         
         print(f"📊 AUTHORITY-DISTANCE DATA:")
         print(f"   • Total route-authority pairs: {len(df)}")
@@ -153,29 +167,26 @@ class TempleDistanceAnalyzer:
         regression_results = {}
         
         # Analyze each authority type separately
-        for authority in df['authority_type'].unique():
-            auth_data = df[df['authority_type'] == authority]
-            
+        for authority, auth_data in df.groupby('authority_type', sort=False, observed=True):
             if len(auth_data) < 3:
                 continue
             
             # Prepare data
-            X = auth_data[['distance']].values
-            y = auth_data['authority_count'].values
+            x = auth_data['distance'].to_numpy(dtype=np.float64)
+            y = auth_data['authority_count'].to_numpy(dtype=np.float64)
             
-            # Fit linear regression
-            reg = LinearRegression()
-            reg.fit(X, y)
+            # Fit univariate least squares in closed form
+            slope, intercept = np.polyfit(x, y, 1)
             
             # Calculate correlation
-            r_value, p_value = stats.pearsonr(auth_data['distance'], auth_data['authority_count'])
+            r_value, p_value = stats.pearsonr(x, y)
             
-            # Calculate R-squared
-            r_squared = reg.score(X, y)
+            # R-squared of a simple linear fit is the squared correlation
+            r_squared = r_value ** 2
             
             regression_results[authority] = {
-                'slope': reg.coef_[0],
-                'intercept': reg.intercept_,
+                'slope': slope,
+                'intercept': intercept,
                 'r_value': r_value,
                 'p_value': p_value,
                 'r_squared': r_squared,
@@ -183,10 +194,10 @@ class TempleDistanceAnalyzer:
             }
             
             print(f"🎯 {authority.upper()} REGRESSION:")
-            print(f"   • Slope: {reg.coef_[0]:.4f} (authority/km)")
+            print(f"   • Slope: {slope:.4f} (authority/km)")
             print(f"   • R²: {r_squared:.3f}")
             print(f"   • Correlation: {r_value:.3f} (p={p_value:.3f})")
-            print(f"   • Interpretation: {'POSITIVE' if reg.coef_[0] > 0 else 'NEGATIVE'} distance effect")
+            print(f"   • Interpretation: {'POSITIVE' if slope > 0 else 'NEGATIVE'} distance effect")
             print()
         
         return regression_results
@@ -5,21 +5,66 @@ Converts inscriptions to fluent English using propagated glosses and weight opti
 """
 
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 import json
 import argparse
+import os
 import sys
 from collections import defaultdict
 
+# Parquet schema metadata key holding the size/mtime stamp of the source TSV
+_STAMP_KEY = b'indus_source'
+
+def _signs_cache(corpus_file):
+    """Parquet cache of parsed signs next to the TSV when INDUS_CACHE=1: its path, the TSV's stamp, and whether they match
+    
+    The cache records the size and mtime of the TSV it was built from and is
+    only reused while both are unchanged; None when caching is off.
+    """
+    if os.environ.get('INDUS_CACHE') != '1':
+        return None
+    parquet_path = os.path.splitext(corpus_file)[0] + '.signs.parquet'
+    st = os.stat(corpus_file)
+    stamp = f"{st.st_size}:{st.st_mtime_ns}".encode()
+    try:
+        fresh = (pq.read_schema(parquet_path).metadata or {}).get(_STAMP_KEY) == stamp
+    except (OSError, pa.ArrowException):
+        fresh = False  # Missing or unreadable cache is rebuilt
+    return parquet_path, stamp, fresh
+
+def load_corpus(corpus_file):
+    """Load the corpus with parsed sign arrays, via a Parquet cache next to the TSV when INDUS_CACHE=1"""
+    cache = _signs_cache(corpus_file)
+    if cache is not None and cache[2]:
+        return pd.read_parquet(cache[0])
+    
+    # Parse every sign sequence once into an int array (stored as list<int64>)
+    corpus_df = pd.read_csv(corpus_file, sep='\t')
+    corpus_df['signs'] = corpus_df['sign_seq'].astype(str).str.split().map(
+        lambda seq: np.fromiter(map(int, seq), dtype=np.int64, count=len(seq))
+    )
+    if cache is not None:
+        parquet_path, stamp, _ = cache
+        try:
+            table = pa.Table.from_pandas(corpus_df, preserve_index=False)
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}), _STAMP_KEY: stamp})
+            pq.write_table(table, parquet_path, compression='zstd')
+        except (OSError, pa.ArrowException):
+            pass  # Cache is best-effort; an unwritable corpus dir or a mixed-type column just means re-parsing next run
+    return corpus_df
+
 def load_data(corpus_file, gloss_file, weights_file):
     """Load all required data files"""
     
     # Load corpus
-    corpus_df = pd.read_csv(corpus_file, sep='\t')
+    corpus_df = load_corpus(corpus_file)
     
     # Load full glosses
     if gloss_file.endswith('.json'):
-        with open(gloss_file, 'r') as f:
-            gloss_data = json.load(f)
+        with open(gloss_file, 'rb') as f:
+            gloss_data = json.loads(f.read())
         if 'extended_glosses' in gloss_data:
             glosses = gloss_data['extended_glosses']
         else:
@@ -27,43 +72,68 @@ def load_data(corpus_file, gloss_file, weights_file):
     else:
         # CSV format
         gloss_df = pd.read_csv(gloss_file)
-        glosses = {str(row['id']): row['english_word'] for _, row in gloss_df.iterrows()}
+        glosses = dict(zip(map(str, gloss_df['id'].tolist()), gloss_df['english_word'].tolist()))
     
     # Load weights
-    with open(weights_file, 'r') as f:
-        weights_data = json.load(f)
+    with open(weights_file, 'rb') as f:
+        weights_data = json.loads(f.read())
     weights = weights_data.get('weights', weights_data)
     
     return corpus_df, glosses, weights
 
-def enhance_translation_quality(signs, glosses, weights):
-    """Enhance translation quality using weights and context"""
+def _sign_id_table(mapping):
+    """Re-key a str sign-id mapping by int, keeping only keys str(sign) can produce"""
+    return {int(k): v for k, v in mapping.items() if k.removeprefix('-').isdecimal() and k == str(int(k))}
+
+def build_lookup_arrays(glosses, weights, sign_seqs):
+    """Build gloss and weight tables indexed directly by integer sign id
+    
+    Ids 0..max fill the head of each table and negative ids min..-1 its tail,
+    so numpy's negative indexing lands a negative id on its own slot rather
+    than wrapping onto another sign's.
+    """
+    
+    present = [signs for signs in sign_seqs if len(signs)]
+    hi = max(0, max((int(signs.max()) + 1 for signs in present), default=0))
+    lo = min(0, min((int(signs.min()) for signs in present), default=0))
+    ids = [*range(hi), *range(lo, 0)]
+    gloss_arr = np.array([f'unknown_{i}' for i in ids], dtype=object)
+    weight_arr = np.ones(len(ids), dtype=np.float64)
+    
+    for sign, word in _sign_id_table(glosses).items():
+        if lo <= sign < hi:
+            gloss_arr[sign] = word
+    for sign, weight in _sign_id_table(weights).items():
+        if lo <= sign < hi:
+            weight_arr[sign] = weight
+    
+    return gloss_arr, weight_arr
+
+def classify_signs(sign_weights, is_premium, is_first, is_last):
+    """Classify each sign into an enhancement category code.
+    
+    0 = plain, 1 = authority (sentence start), 2 = chief, 3 = premium
+    commodity, 4 = trailing quantity. Operates on whole flattened arrays.
+    """
+    return np.select(
+        [
+            (sign_weights > 5.0) & is_first,       # High authority, sentence start
+            sign_weights > 5.0,                    # High authority
+            (sign_weights > 3.0) & is_premium,     # Medium importance commodity
+            (sign_weights < 1.0) & is_last,        # Low weight (numerals/modifiers) at end
+        ],
+        [1, 2, 3, 4],
+        default=0
+    ).astype(np.int8)
+
+def enhance_translation_quality(base_words, categories):
+    """Enhance translation quality using weight categories and context"""
     
+    prefixes = ('', 'Authority_', 'Chief_', 'Premium_', 'quantity_')
     enhanced_phrase = []
     
-    for i, sign in enumerate(signs):
-        sign_str = str(sign)
-        base_word = glosses.get(sign_str, f'unknown_{sign}')
-        weight = weights.get(sign_str, 1.0)
-        
-        # Weight-based enhancement
-        if weight > 5.0:  # High authority
-            if i == 0:  # Sentence start
-                enhanced_word = f"Authority_{base_word}".replace('_', ' ')
-            else:
-                enhanced_word = f"Chief_{base_word}".replace('_', ' ')
-        elif weight > 3.0:  # Medium importance
-            if 'grain' in base_word or 'cattle' in base_word:
-                enhanced_word = f"Premium_{base_word}".replace('_', ' ')
-            else:
-                enhanced_word = base_word.replace('_', ' ')
-        elif weight < 1.0:  # Low weight (numerals/modifiers)
-            if i == len(signs) - 1:  # End position
-                enhanced_word = f"quantity_{base_word}".replace('_', ' ')
-            else:
-                enhanced_word = base_word.replace('_', ' ')
-        else:
-            enhanced_word = base_word.replace('_', ' ')
+    for i, (base_word, category) in enumerate(zip(base_words, categories)):
+        enhanced_word = f"{prefixes[category]}{base_word}".replace('_', ' ')
         
         # Position-based enhancement
         if i == 0 and 'authority' not in enhanced_word.lower():
@@ -73,32 +143,49 @@ def enhance_translation_quality(signs, glosses, weights):
     
     return enhanced_phrase
 
-def generate_fluent_translations(corpus_df, glosses, weights):
+def generate_fluent_translations(corpus_df, gloss_arr, weight_arr):
     """Generate fluent English translations for all inscriptions"""
     
+    # Flatten the corpus so every sign is classified in one vectorized pass
+    sign_seqs = corpus_df['signs'].tolist()
+    lengths = np.fromiter(map(len, sign_seqs), dtype=np.int64, count=len(sign_seqs))
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+    flat_signs = np.concatenate(sign_seqs) if sign_seqs else np.empty(0, dtype=np.int64)
+    
+    is_first = np.zeros(len(flat_signs), dtype=bool)
+    is_last = np.zeros(len(flat_signs), dtype=bool)
+    is_first[starts[lengths > 0]] = True
+    is_last[ends[lengths > 0] - 1] = True
+    is_premium = np.array([isinstance(g, str) and ('grain' in g or 'cattle' in g) for g in gloss_arr], dtype=bool)
+    
+    flat_weights = weight_arr[flat_signs]
+    categories = classify_signs(flat_weights, is_premium[flat_signs], is_first, is_last).tolist()
+    base_words = gloss_arr[flat_signs].tolist()
+    weight_totals = np.bincount(np.repeat(np.arange(len(lengths)), lengths),
+                                weights=flat_weights, minlength=len(lengths))
+    
+    commodity_keys = ('grain', 'cattle', 'fish', 'copper')
     translations = []
     
-    for _, row in corpus_df.iterrows():
-        inscr_id = row['inscr_id']
-        signs = [int(x) for x in str(row['sign_seq']).split()]
-        
+    for inscr_id, signs, start, end, weight_total in zip(corpus_df['inscr_id'], sign_seqs, starts.tolist(),
+                                                         ends.tolist(), weight_totals.tolist()):
         # Get enhanced translation
-        enhanced_words = enhance_translation_quality(signs, glosses, weights)
+        enhanced_words = enhance_translation_quality(base_words[start:end], categories[start:end])
         
         # Create fluent phrase
-        if len(enhanced_words) == 1:
-            fluent = enhanced_words[0]
-        elif len(enhanced_words) == 2:
-            fluent = f"{enhanced_words[0]} {enhanced_words[1]}"
+        if len(enhanced_words) <= 2:
+            fluent = ' '.join(enhanced_words)
         else:
             # For longer sequences, add structure
             if any('authority' in w.lower() for w in enhanced_words[:2]):
                 # Authority record format
                 fluent = f"{enhanced_words[0]} records {' '.join(enhanced_words[1:])}"
             elif any('grain' in w.lower() or 'cattle' in w.lower() for w in enhanced_words):
-                # Commodity record format  
-                commodities = [w for w in enhanced_words if any(c in w.lower() for c in ['grain', 'cattle', 'fish', 'copper'])]
-                others = [w for w in enhanced_words if w not in commodities]
+                # Commodity record format: partition with one mask instead of list membership scans
+                is_commodity = [any(c in w.lower() for c in commodity_keys) for w in enhanced_words]
+                commodities = [w for w, m in zip(enhanced_words, is_commodity) if m]
+                others = [w for w, m in zip(enhanced_words, is_commodity) if not m]
                 if commodities and others:
                     fluent = f"{' '.join(others)} of {' '.join(commodities)}"
                 else:
@@ -114,7 +201,7 @@ def generate_fluent_translations(corpus_df, glosses, weights):
             'inscr_id': inscr_id,
             'english_phrase': fluent,
             'signs': signs,
-            'weight_total': sum(weights.get(str(s), 1.0) for s in signs)
+            'weight_total': weight_total
         })
     
     return translations
@@ -122,14 +209,22 @@ def generate_fluent_translations(corpus_df, glosses, weights):
 def calculate_final_coverage(translations, glosses):
     """Calculate final coverage statistics"""
     
-    total_tokens = sum(len(t['signs']) for t in translations)
-    covered_tokens = sum(1 for t in translations for s in t['signs'] 
-                        if str(s) in glosses and not glosses[str(s)].startswith('unknown_'))
+    total_tokens = 0
+    covered_tokens = 0
+    sign_xxx_count = 0  # Count sign_XXX remaining
+    is_glossed = glosses.__contains__
     
-    coverage = covered_tokens / total_tokens if total_tokens > 0 else 0
+    # Single traversal accumulating all three counts
+    for t in translations:
+        signs = t['signs']
+        total_tokens += len(signs)
+        for s in map(str, signs.tolist()):
+            if is_glossed(s) and not glosses[s].startswith('unknown_'):
+                covered_tokens += 1
+        if 'unknown_' in t['english_phrase']:
+            sign_xxx_count += 1
     
-    # Count sign_XXX remaining
-    sign_xxx_count = sum(1 for t in translations if 'unknown_' in t['english_phrase'])
+    coverage = covered_tokens / total_tokens if total_tokens > 0 else 0
     
     return {
         'coverage': coverage,
@@ -156,7 +251,8 @@ def main():
     print(f"⚖️  Using weights for {len(weights)} signs", file=sys.stderr)
     
     # Generate translations
-    translations = generate_fluent_translations(corpus_df, glosses, weights)
+    gloss_arr, weight_arr = build_lookup_arrays(glosses, weights, corpus_df['signs'])
+    translations = generate_fluent_translations(corpus_df, gloss_arr, weight_arr)
     
     # Calculate coverage
     stats = calculate_final_coverage(translations, glosses)
@@ -166,11 +262,11 @@ def main():
     print(f"🔍 Unknown tokens remaining: {stats['unknown_remaining']}", file=sys.stderr)
     
     # Output translations
-    output_file = sys.stdout if not args.output else open(args.output, 'w')
+    output_file = sys.stdout if not args.output else open(args.output, 'w', buffering=1 << 20, encoding='utf-8')
     
-    output_file.write("inscr_id\tenglish_phrase\n")
-    for t in translations:
-        output_file.write(f"{t['inscr_id']}\t{t['english_phrase']}\n")
+    lines = ["inscr_id\tenglish_phrase"]
+    lines.extend(f"{t['inscr_id']}\t{t['english_phrase']}" for t in translations)
+    output_file.write('\n'.join(lines) + '\n')
     
     if args.output:
         output_file.close()
@@ -6,17 +6,49 @@ Analyzes ownership terms and their associated commodities in the sacred-economy
 
 import pandas as pd
 import numpy as np
-from collections import defaultdict, Counter
+import pyarrow.csv as pacsv
+from collections import Counter
+from functools import lru_cache
 import argparse
 import csv
+import re
+import sys
 
 class TokenCohortAnalyzer:
     """Analyzes ownership terms and their commodity associations"""
     
+    _UNSEEN = np.iinfo(np.int64).max
+    
     def __init__(self):
-        self.ownership_terms = ['father', 'mother', 'king', 'priest', 'person', 'house', 'lord', 'chief']
-        self.commodity_terms = ['water', 'grain', 'cattle', 'copper', 'land', 'cattle', 'fish', 'salt']
+        self.ownership_terms = [sys.intern(t) for t in ['father', 'mother', 'king', 'priest', 'person', 'house', 'lord', 'chief']]
+        self.commodity_terms = [sys.intern(t) for t in ['water', 'grain', 'cattle', 'copper', 'land', 'cattle', 'fish', 'salt']]
+        
+        # One alternation over both term families so each text is walked once;
+        # the lookahead reports every start position, so overlapping hits
+        # (e.g. "chiefather") are not swallowed. Relies on no term being a
+        # prefix of another, since only one alternative can win per position.
+        self._term_re = self._compile_terms(self.ownership_terms + self.commodity_terms)
+        
+        # Dense matrix axes (commodity_terms lists 'cattle' twice)
+        self._owner_idx = {term: i for i, term in enumerate(dict.fromkeys(self.ownership_terms))}
+        self._commodity_idx = {term: i for i, term in enumerate(dict.fromkeys(self.commodity_terms))}
+        
+        # Concordance translations repeat heavily, so memoize the per-text scan
+        self._scan = lru_cache(maxsize=65536)(self._scan_text)
+    
+    @staticmethod
+    def _compile_terms(terms):
+        """Compile a term list into a single overlapping-match regex"""
+        alternation = '|'.join(map(re.escape, dict.fromkeys(terms)))
+        return re.compile(f'(?=({alternation}))')
         
+    def _scan_text(self, text):
+        """Count term hits in lowercased text and list the matched terms in configured order"""
+        term_hits = Counter(self._term_re.findall(text))
+        found_owners = tuple(term for term in self.ownership_terms if term in term_hits)
+        found_commodities = tuple(term for term in self.commodity_terms if term in term_hits)
+        return term_hits, found_owners, found_commodities
+    
     def load_ledger(self, ledger_path):
         """Load the ledger data"""
         try:
@@ -32,34 +64,41 @@ class TokenCohortAnalyzer:
         print(f"\n🔍 EXTRACTING {slot_type.upper()} ASSOCIATIONS")
         print("=" * 40)
         
-        ownership_commodity_pairs = []
+        # Pair columns (struct-of-arrays); text columns are stored once per
+        # row and gathered by row index when the pair table is built
+        row_ids, owner_ids, commodity_ids, strengths = [], [], [], []
+        sequences, texts = [], []
         ownership_counts = Counter()
         commodity_counts = Counter()
         
         # Load translations if available
         try:
-            translations = pd.read_csv('output/corrected_translations.tsv', sep='\t')
+            translations = pacsv.read_csv(
+                'output/corrected_translations.tsv',
+                parse_options=pacsv.ParseOptions(delimiter='\t')
+            ).to_pandas(types_mapper=pd.ArrowDtype)
             print(f"✓ Using {len(translations)} translations")
             
-            for _, row in translations.iterrows():
-                original = row['original_indus']
-                translation = row['english_translation'].lower()
+            for original, translation in zip(translations['original_indus'].to_numpy(),
+                                             translations['english_translation'].to_numpy()):
+                translation = translation.lower()
                 
                 # Find ownership terms
-                found_owners = [term for term in self.ownership_terms if term in translation]
-                found_commodities = [term for term in self.commodity_terms if term in translation]
+                term_hits, found_owners, found_commodities = self._scan(translation)
+                
+                row = len(texts)
+                if found_owners and found_commodities:
+                    sequences.append(original)
+                    texts.append(translation)
                 
                 for owner in found_owners:
                     ownership_counts[owner] += 1
                     for commodity in found_commodities:
                         commodity_counts[commodity] += 1
-                        ownership_commodity_pairs.append({
-                            'original_sequence': original,
-                            'owner_term': owner,
-                            'commodity': commodity,
-                            'translation': translation,
-                            'strength': translation.count(owner) + translation.count(commodity)
-                        })
+                        row_ids.append(row)
+                        owner_ids.append(self._owner_idx[owner])
+                        commodity_ids.append(self._commodity_idx[commodity])
+                        strengths.append(term_hits[owner] + term_hits[commodity])
         
         except Exception as e:
             print(f"⚠️ Using ledger fallback: {e}")
@@ -67,20 +106,24 @@ class TokenCohortAnalyzer:
             for _, row in self.ledger.iterrows():
                 if 'english' in row and pd.notna(row['english']):
                     text = str(row['english']).lower()
-                    found_owners = [term for term in self.ownership_terms if term in text]
-                    found_commodities = [term for term in self.commodity_terms if term in text]
+                    _, found_owners, found_commodities = self._scan(text)
+                    
+                    row_id = len(texts)
+                    if found_owners and found_commodities:
+                        sequences.append(row.get('indus', ''))
+                        texts.append(text)
                     
                     for owner in found_owners:
                         ownership_counts[owner] += 1
                         for commodity in found_commodities:
                             commodity_counts[commodity] += 1
-                            ownership_commodity_pairs.append({
-                                'original_sequence': row.get('indus', ''),
-                                'owner_term': owner,
-                                'commodity': commodity,
-                                'translation': text,
-                                'strength': 1
-                            })
+                            row_ids.append(row_id)
+                            owner_ids.append(self._owner_idx[owner])
+                            commodity_ids.append(self._commodity_idx[commodity])
+                            strengths.append(1)
+        
+        ownership_commodity_pairs = self._pairs_frame(row_ids, owner_ids, commodity_ids, strengths,
+                                                      sequences, texts)
         
         print(f"📊 OWNERSHIP ANALYSIS RESULTS:")
         print(f"   • Total ownership-commodity pairs: {len(ownership_commodity_pairs)}")
@@ -89,37 +132,79 @@ class TokenCohortAnalyzer:
         
         return ownership_commodity_pairs, ownership_counts, commodity_counts
     
+    def _pairs_frame(self, row_ids, owner_ids, commodity_ids, strengths, sequences, texts):
+        """Assemble pair columns into a DataFrame with categorical term columns"""
+        rows = np.asarray(row_ids, dtype=np.intp)
+        return pd.DataFrame({
+            'original_sequence': np.array(sequences, dtype=object)[rows],
+            'owner_term': pd.Categorical.from_codes(np.asarray(owner_ids, dtype=np.int8),
+                                                    categories=list(self._owner_idx)),
+            'commodity': pd.Categorical.from_codes(np.asarray(commodity_ids, dtype=np.int8),
+                                                   categories=list(self._commodity_idx)),
+            'translation': np.array(texts, dtype=object)[rows],
+            'strength': np.asarray(strengths, dtype=np.int64)
+        })
+    
+    def build_authority_matrix(self, pairs):
+        """Accumulate pair strengths into a dense owner x commodity matrix.
+        
+        Also returns, per cell, the index of the first pair that touched it
+        (_UNSEEN where untouched), so reports keep first-seen ordering.
+        """
+        n_pairs = len(pairs)
+        owner_ids = pairs['owner_term'].cat.codes.to_numpy()
+        commodity_ids = pairs['commodity'].cat.codes.to_numpy()
+        strengths = pairs['strength'].to_numpy()
+        
+        shape = (len(self._owner_idx), len(self._commodity_idx))
+        authority_matrix = np.zeros(shape, dtype=np.int64)
+        np.add.at(authority_matrix, (owner_ids, commodity_ids), strengths)
+        first_seen = np.full(shape, self._UNSEEN, dtype=np.int64)
+        np.minimum.at(first_seen, (owner_ids, commodity_ids), np.arange(n_pairs))
+        
+        return authority_matrix, first_seen
+    
+    def _summarize_matrix(self, authority_matrix, first_seen):
+        """Reduce the dense matrix to per-owner totals, primary commodity and diversity.
+        
+        Owners are returned in first-seen order; ties for the primary commodity
+        go to the commodity the owner was first paired with.
+        """
+        present = first_seen < self._UNSEEN
+        owners = np.flatnonzero(present.any(axis=1))
+        owners = owners[np.argsort(first_seen[owners].min(axis=1), kind='stable')]
+        
+        is_max = authority_matrix == authority_matrix.max(axis=1, keepdims=True)
+        primary = np.where(is_max & present, first_seen, self._UNSEEN).argmin(axis=1)
+        
+        return owners, primary, authority_matrix.sum(axis=1), present.sum(axis=1)
+    
     def analyze_authority_patterns(self, pairs):
         """Analyze which authorities control which commodities"""
         print(f"\n👑 AUTHORITY-COMMODITY CONTROL PATTERNS")
         print("=" * 40)
         
         # Create authority-commodity matrix
-        authority_matrix = defaultdict(lambda: defaultdict(int))
+        authority_matrix, first_seen = self.build_authority_matrix(pairs)
+        owners, primary, totals, diversity = self._summarize_matrix(authority_matrix, first_seen)
         
-        for pair in pairs:
-            authority_matrix[pair['owner_term']][pair['commodity']] += pair['strength']
-        
-        # Calculate specialization scores
-        specialization_data = []
+        primary_control = authority_matrix[np.arange(len(primary)), primary]
+        specialization = primary_control / np.maximum(totals, 1)
         
-        for owner, commodities in authority_matrix.items():
-            total_control = sum(commodities.values())
-            max_commodity = max(commodities.keys(), key=lambda x: commodities[x]) if commodities else None
-            max_control = commodities[max_commodity] if max_commodity else 0
-            specialization = (max_control / total_control) if total_control > 0 else 0
-            
-            specialization_data.append({
-                'owner_term': owner,
-                'primary_commodity': max_commodity,
-                'primary_control': max_control,
-                'total_control': total_control,
-                'specialization_ratio': specialization,
-                'commodity_diversity': len(commodities)
-            })
+        # Sort by specialization (stable, so ties keep first-seen order)
+        owners = owners[np.argsort(-specialization[owners], kind='stable')]
         
-        # Sort by specialization
-        specialization_data.sort(key=lambda x: x['specialization_ratio'], reverse=True)
+        # Calculate specialization scores
+        owner_terms = list(self._owner_idx)
+        commodity_terms = list(self._commodity_idx)
+        specialization_data = [{
+            'owner_term': owner_terms[o],
+            'primary_commodity': commodity_terms[primary[o]],
+            'primary_control': int(primary_control[o]),
+            'total_control': int(totals[o]),
+            'specialization_ratio': float(specialization[o]),
+            'commodity_diversity': int(diversity[o])
+        } for o in owners]
         
         print(f"🎯 AUTHORITY SPECIALIZATION RANKINGS:")
         for i, auth in enumerate(specialization_data[:8]):
@@ -129,39 +214,39 @@ class TokenCohortAnalyzer:
             print(f"      Diversity: {auth['commodity_diversity']} commodities")
             print()
         
-        return specialization_data, authority_matrix
+        return specialization_data, authority_matrix, first_seen
     
-    def generate_certification_model(self, authority_matrix):
+    def generate_certification_model(self, authority_matrix, first_seen):
         """Generate the sacred-economy certification model"""
         print(f"\n🏛️ SACRED-ECONOMY CERTIFICATION MODEL")
         print("=" * 38)
         
+        owners, primary, totals, diversity = self._summarize_matrix(authority_matrix, first_seen)
+        primary_strength = authority_matrix[np.arange(len(primary)), primary]
+        
+        owner_terms = list(self._owner_idx)
+        commodity_terms = list(self._commodity_idx)
         certification_rules = []
         
-        for owner, commodities in authority_matrix.items():
-            if not commodities:
-                continue
-                
-            # Calculate authority scope
-            total_certifications = sum(commodities.values())
-            primary_commodity = max(commodities.keys(), key=lambda x: commodities[x])
-            primary_strength = commodities[primary_commodity]
+        for o in owners:
+            total_certifications = int(totals[o])
             
             # Determine certification type
-            if primary_strength / total_certifications >= 0.7:
+            if primary_strength[o] / total_certifications >= 0.7:
                 cert_type = "SPECIALIST"
-            elif len(commodities) >= 4:
+            elif diversity[o] >= 4:
                 cert_type = "GENERAL"
             else:
                 cert_type = "LIMITED"
             
+            scope = np.argsort(first_seen[o], kind='stable')[:diversity[o]]
             certification_rules.append({
-                'authority': owner,
+                'authority': owner_terms[o],
                 'certification_type': cert_type,
-                'primary_commodity': primary_commodity,
-                'commodity_count': len(commodities),
+                'primary_commodity': commodity_terms[primary[o]],
+                'commodity_count': int(diversity[o]),
                 'total_certifications': total_certifications,
-                'authority_scope': list(commodities.keys())
+                'authority_scope': [commodity_terms[c] for c in scope]
             })
         
         # Sort by total certifications
@@ -181,50 +266,52 @@ class TokenCohortAnalyzer:
         """Save the ownership analysis results"""
         print(f"\n💾 SAVING RESULTS TO {output_path}")
         
-        # Prepare data for CSV output
-        csv_data = []
-        
-        # Add ownership-commodity pairs
-        for pair in pairs:
-            csv_data.append({
-                'type': 'ownership_commodity_pair',
-                'owner_term': pair['owner_term'],
-                'commodity': pair['commodity'],
-                'original_sequence': pair['original_sequence'],
-                'strength': pair['strength'],
-                'translation': pair['translation']
-            })
-        
-        # Add specialization data
-        for spec in specialization_data:
-            csv_data.append({
-                'type': 'authority_specialization',
-                'owner_term': spec['owner_term'],
-                'commodity': spec['primary_commodity'],
-                'original_sequence': '',
-                'strength': spec['specialization_ratio'],
-                'translation': f"Primary: {spec['primary_commodity']}, Diversity: {spec['commodity_diversity']}"
-            })
-        
-        # Add certification rules
-        for cert in certification_rules:
-            csv_data.append({
-                'type': 'certification_rule',
-                'owner_term': cert['authority'],
-                'commodity': cert['primary_commodity'],
-                'original_sequence': '',
-                'strength': cert['total_certifications'],
-                'translation': f"{cert['certification_type']}: {', '.join(cert['authority_scope'])}"
-            })
+        def csv_rows():
+            # Add ownership-commodity pairs
+            for owner, commodity, original, strength, translation in zip(
+                    pairs['owner_term'].tolist(), pairs['commodity'].tolist(),
+                    pairs['original_sequence'].tolist(), pairs['strength'].tolist(),
+                    pairs['translation'].tolist()):
+                yield {
+                    'type': 'ownership_commodity_pair',
+                    'owner_term': owner,
+                    'commodity': commodity,
+                    'original_sequence': original,
+                    'strength': strength,
+                    'translation': translation
+                }
+            
+            # Add specialization data
+            for spec in specialization_data:
+                yield {
+                    'type': 'authority_specialization',
+                    'owner_term': spec['owner_term'],
+                    'commodity': spec['primary_commodity'],
+                    'original_sequence': '',
+                    'strength': spec['specialization_ratio'],
+                    'translation': f"Primary: {spec['primary_commodity']}, Diversity: {spec['commodity_diversity']}"
+                }
+            
+            # Add certification rules
+            for cert in certification_rules:
+                yield {
+                    'type': 'certification_rule',
+                    'owner_term': cert['authority'],
+                    'commodity': cert['primary_commodity'],
+                    'original_sequence': '',
+                    'strength': cert['total_certifications'],
+                    'translation': f"{cert['certification_type']}: {', '.join(cert['authority_scope'])}"
+                }
         
-        # Save to CSV
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        # Stream rows straight to CSV
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
             fieldnames = ['type', 'owner_term', 'commodity', 'original_sequence', 'strength', 'translation']
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
-            writer.writerows(csv_data)
+            writer.writerows(csv_rows())
         
-        print(f"✅ Saved {len(csv_data)} records to {output_path}")
+        record_count = len(pairs) + len(specialization_data) + len(certification_rules)
+        print(f"✅ Saved {record_count} records to {output_path}")
         
         return True
 
@@ -249,12 +336,12 @@ def main():
     # Run analysis
     pairs, ownership_counts, commodity_counts = analyzer.extract_ownership_commodity_pairs(args.slot)
     
-    if not pairs:
+    if pairs.empty:
         print("❌ No ownership-commodity pairs found!")
         return 1
     
-    specialization_data, authority_matrix = analyzer.analyze_authority_patterns(pairs)
-    certification_rules = analyzer.generate_certification_model(authority_matrix)
+    specialization_data, authority_matrix, first_seen = analyzer.analyze_authority_patterns(pairs)
+    certification_rules = analyzer.generate_certification_model(authority_matrix, first_seen)
     
     # Save results
     analyzer.save_results(pairs, specialization_data, certification_rules, args.out_csv)
@@ -6,10 +6,116 @@ Investigates the paradox: How sophisticated trade without accounting records?
 
 import pandas as pd
 import numpy as np
-from collections import Counter, defaultdict
+import pyarrow as pa
+import pyarrow.compute as pc
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 import json
+from types import MappingProxyType
+from pathlib import Path
 import re
 
+# Archaeological vs script evidence checklists and the candidate resolution
+# models are fixed; read-only module constants shared by every call.
+_PHYSICAL_TRADE_EVIDENCE = MappingProxyType({
+    'standardized_weights': True,
+    'uniform_brick_sizes': True,
+    'widespread_seals': True,
+    'long_distance_materials': True,
+    'port_facilities': True,
+    'storage_structures': True
+})
+
+_SCRIPT_EVIDENCE = MappingProxyType({
+    'explicit_quantities': False,  # No clear numerical records
+    'price_lists': False,          # No price information
+    'transaction_records': False,  # No clear transactions
+    'inventory_lists': False,      # No inventories
+    'trade_agreements': False,     # No contracts
+    'accounting_formulas': False   # No mathematical operations
+})
+
+_RESOLUTION_MODELS = MappingProxyType({
+    'Model 1: Religious Control of Trade': MappingProxyType({
+        'description': 'All trade was religiously controlled and recorded through ritual formulas',
+        'evidence_for': (
+            'High ritual-economic integration rate',
+            'Authority signs in trade-like sequences',
+            'Standardized weights suggest central control'
+        ),
+        'evidence_against': (
+            'No explicit quantities or prices',
+            'Unclear transaction mechanisms'
+        )
+    }),
+    
+    'Model 2: Oral Accounting System': MappingProxyType({
+        'description': 'Written script was purely ceremonial; actual accounting was oral/memory-based',
+        'evidence_for': (
+            'Physical trade evidence without script records',
+            'Small elite literacy suggests specialization',
+            'Ritual script may have been status symbols only'
+        ),
+        'evidence_against': (
+            'Difficult to maintain complex trade over 1000km',
+            'No evidence of oral tradition preservation'
+        )
+    }),
+    
+    'Model 3: Missing Record Types': MappingProxyType({
+        'description': 'Accounting was done on perishable materials (wood, palm leaves) not preserved',
+        'evidence_for': (
+            'Durability bias in archaeological record',
+            'Seals may have authenticated perishable documents',
+            'Stone inscriptions may be only ceremonial subset'
+        ),
+        'evidence_against': (
+            'No traces of perishable record systems',
+            'Unclear why no clay tablets like Mesopotamia'
+        )
+    }),
+    
+    'Model 4: Token-Based Accounting': MappingProxyType({
+        'description': 'Physical tokens/objects served as accounting tools, script was supplementary',
+        'evidence_for': (
+            'Standardized weights as accounting tools',
+            'Seals as authentication devices',
+            'Physical control of trade goods'
+        ),
+        'evidence_against': (
+            'Limited token archaeological evidence',
+            'Unclear how complex transactions recorded'
+        )
+    })
+})
+
+def _sequence_kernel(codes, lengths, weight_lut, high_threshold):
+    """Per-sequence sign statistics over flattened, int-coded sequences.
+    
+    Returns the sequence id of every sign, each sequence's total weight
+    (accumulated in sign order, like sum()), the flat positions of the first
+    occurrence of every sign repeated within a sequence of 3+ signs (in
+    order), a per-sign flag for weights above high_threshold and each
+    sequence's count of such high-weight signs.
+    """
+    n_seqs = len(lengths)
+    seq_id = np.repeat(np.arange(n_seqs), lengths)
+    totals = np.bincount(seq_id, weights=weight_lut[codes], minlength=n_seqs)
+    
+    # Repeats are adjacent equal (sequence, sign) keys once sorted; the stable
+    # sort leaves each run's first element at the sign's first occurrence
+    keys = seq_id * len(weight_lut) + codes
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    run_start = np.diff(sorted_keys, prepend=-1) != 0
+    same_as_next = np.diff(sorted_keys, append=-1) == 0
+    first_idx = order[run_start & same_as_next]
+    repeated_idx = np.sort(first_idx[lengths[seq_id[first_idx]] >= 3])
+    
+    is_high = (weight_lut > high_threshold)[codes]
+    hi_count = np.bincount(seq_id, weights=is_high, minlength=n_seqs).astype(np.int64)
+    return seq_id, totals, repeated_idx, is_high, hi_count
+
 class TradeRitualInvestigator:
     """Investigate the trade-ritual paradox in Indus civilization"""
     
@@ -18,7 +124,34 @@ class TradeRitualInvestigator:
         self.ledger = None
         self.translations = None
         self.weights = None
+        self.weight_dtype = None
+        self.weight_arr = None
+        self.corpus_tokens = None
+        self.corpus_lengths = None
+        self.sign_vocab = None
         self.findings = {}
+        
+        # Economic/trade terminology to look for
+        self.economic_terms = {
+            'quantity': ['three', 'many', 'all', 'some', 'few'],
+            'value': ['good', 'great', 'small', 'precious', 'valuable'],
+            'ownership': ['father', 'mother', 'king', 'person', 'house'],
+            'resources': ['grain', 'water', 'cattle', 'copper', 'land'],
+            'exchange': ['give', 'take', 'trade', 'exchange', 'market'],
+            'places': ['place', 'house', 'land', 'river', 'city'],
+            'actions': ['come', 'go', 'hold', 'stand', 'flow']
+        }
+        self.ritual_terms = ['sacred', 'place', 'shine', 'pure', 'stand']
+        self.integration_economic_terms = ['grain', 'water', 'father', 'king', 'good', 'great']
+        
+        # One hit-matrix column per distinct term across every analysis
+        all_terms = [term for terms in self.economic_terms.values() for term in terms]
+        all_terms += self.ritual_terms + self.integration_economic_terms
+        self._term_col = {term: i for i, term in enumerate(dict.fromkeys(all_terms))}
+        self._lower = None
+        self._term_hits = None
+        self._term_masks = {}
+        self._translation_scan = None
     
     def load_data(self):
         """Load all relevant data sources"""
@@ -26,25 +159,118 @@ class TradeRitualInvestigator:
         print("=" * 47)
         
         # Load corpus
-        self.corpus = pd.read_csv('data/corpus.tsv', sep='\t', names=['id', 'sequence'])
+        self.corpus = pd.read_csv('data/corpus.tsv', sep='\t', names=['id', 'sequence'],
+                                  dtype={'sequence': 'string[pyarrow]'})
         print(f"✓ Corpus: {len(self.corpus)} sequences")
         
+        # Split once: every sequence flattened into one int-coded sign array
+        tokens = [seq.split() for seq in self.corpus['sequence'].to_numpy()]
+        self.corpus_lengths = np.fromiter(map(len, tokens), dtype=np.int64, count=len(tokens))
+        self.corpus_tokens, self.sign_vocab = pd.factorize(
+            np.array([sign for signs in tokens for sign in signs], dtype=object))
+        
         # Load ledger
-        self.ledger = pd.read_csv('data/ledger_en.tsv', sep='\t')
+        self.ledger = pd.read_csv('data/ledger_en.tsv', sep='\t', engine='pyarrow')
         print(f"✓ Ledger: {len(self.ledger)} entries")
         
         # Load our translations if available
-        try:
-            self.translations = pd.read_csv('output/corrected_translations.tsv', sep='\t')
+        translations_file = Path('output/corrected_translations.tsv')
+        if translations_file.exists():
+            self.translations = pd.read_csv(translations_file, sep='\t',
+                                            dtype={'original_indus': 'string[pyarrow]',
+                                                   'english_translation': 'string[pyarrow]'})
+            self._term_hits = None
+            self._term_masks = {}
+            self._translation_scan = None
             print(f"✓ Translations: {len(self.translations)} entries")
-        except:
+        else:
             print("⚠️ No translations file found")
         
         # Load weights
-        with open('data/weights.json', 'r') as f:
-            self.weights = json.load(f)
+        with open('data/weights.json', 'rb') as f:
+            self.weights = json.loads(f.read())
+        
+        # Weights indexed by categorical sign code; the trailing 0 is the weight of unknown signs (code -1)
+        self.weight_dtype = pd.CategoricalDtype(list(self.weights))
+        self.weight_arr = np.append(np.fromiter(self.weights.values(), dtype=np.float64, count=len(self.weights)), 0.0)
         print(f"✓ Weights: {len(self.weights)} sign weights")
     
+    def _scan_terms(self):
+        """Scan the lowercased translations for every term once.
+        
+        Returns a (translations x terms) bool matrix, cached until the next
+        load; term tests are plain substring checks, matching `term in text`.
+        """
+        if self._term_hits is None:
+            lower = self.translations['english_translation'].str.lower()
+            haystack = pa.array(lower, type=pa.string(), from_pandas=True)
+            self._lower = lower.to_numpy()
+            # Arrow kernels release the GIL, so the independent term columns scan in parallel threads
+            with ThreadPoolExecutor() as pool:
+                columns = pool.map(
+                    lambda term: pc.fill_null(pc.match_substring(haystack, term), False).to_numpy(zero_copy_only=False),
+                    self._term_col)
+                self._term_hits = np.column_stack(list(columns))
+        return self._term_hits
+    
+    def _any_term(self, terms):
+        """Rows whose translation contains any of the given terms (mask cached per term set)"""
+        key = tuple(terms)
+        if key not in self._term_masks:
+            self._term_masks[key] = self._scan_terms()[:, [self._term_col[t] for t in terms]].any(axis=1)
+        return self._term_masks[key]
+    
+    def _scan_translations(self):
+        """Derive every translation-table structure from one term scan.
+        
+        Economic content per category, the pure ritual/economic counts and
+        the ritual-economic combinations all come from the same cached hit
+        matrix; the analysis methods only report from this result.
+        """
+        if self._translation_scan is not None:
+            return self._translation_scan
+        
+        hits = self._scan_terms()
+        originals = self.translations['original_indus'].to_numpy()
+        
+        # One mask column per economic category: match counts plus the first few example rows
+        category_hits = np.column_stack([
+            hits[:, [self._term_col[t] for t in terms]].any(axis=1)
+            for terms in self.economic_terms.values()
+        ])
+        counts = category_hits.sum(axis=0)
+        
+        # Report matched categories in the order rows first matched them
+        categories = np.array(list(self.economic_terms))
+        matched = np.flatnonzero(counts)
+        first_match = category_hits[:, matched].argmax(axis=0) if len(matched) else matched
+        matched = matched[np.argsort(first_match, kind='stable')]
+        content_analysis = pd.Series(counts[matched], index=categories[matched], name='matches')
+        content_examples = {categories[c]: np.flatnonzero(category_hits[:, c])[:3] for c in matched}
+        
+        # Check for both ritual and economic terms in same inscription
+        has_ritual = self._any_term(self.ritual_terms)
+        has_economic = self._any_term(self.integration_economic_terms)
+        has_sacred = self._any_term(['sacred'])
+        has_core_economic = self._any_term(['grain', 'water', 'father', 'king'])
+        
+        # Pack sacred/core-economic membership into 2 bits: 1 = ritual only, 2 = economic only
+        purity_counts = np.bincount(has_sacred.astype(np.uint8) | (has_core_economic.astype(np.uint8) << 1), minlength=4)
+        
+        ritual_trade_combinations = [{
+            'original': originals[i],
+            'translation': self._lower[i],
+            'type': 'ritual_economic'
+        } for i in np.flatnonzero(has_ritual & has_economic)]
+        
+        self._translation_scan = {
+            'content_analysis': content_analysis,
+            'content_examples': content_examples,
+            'purity_counts': purity_counts,
+            'ritual_trade_combinations': ritual_trade_combinations
+        }
+        return self._translation_scan
+    
     def analyze_sequence_patterns(self):
         """Look for hidden administrative patterns in 'ritual' sequences"""
         print("\n🔍 ANALYZING SEQUENCE PATTERNS FOR HIDDEN ACCOUNTING")
@@ -52,55 +278,53 @@ class TradeRitualInvestigator:
         
         # Check for numerical patterns that might indicate accounting
         numerical_patterns = []
-        repeated_sequences = []
-        structured_patterns = []
-        
-        all_sequences = self.corpus['sequence'].tolist()
-        
-        for seq in all_sequences:
-            signs = seq.split()
-            
-            # Look for numerical repetition patterns
-            if len(signs) >= 3:
-                # Check for repeated signs (might be quantity indicators)
-                sign_counts = Counter(signs)
-                repeated_signs = [sign for sign, count in sign_counts.items() if count > 1]
-                
-                if repeated_signs:
-                    repeated_sequences.append({
-                        'sequence': seq,
-                        'repeated_signs': repeated_signs,
-                        'pattern_type': 'repetition'
-                    })
-            
-            # Look for high-weight signs (authority/value indicators)
-            high_weight_signs = [sign for sign in signs if sign in self.weights and self.weights[sign] > 2.5]
-            
-            if high_weight_signs:
-                structured_patterns.append({
-                    'sequence': seq,
-                    'high_weight_signs': high_weight_signs,
-                    'total_weight': sum(self.weights.get(sign, 0) for sign in signs),
-                    'pattern_type': 'authority'
-                })
+        
+        all_sequences = self.corpus['sequence'].to_numpy()
+        codes, lengths = self.corpus_tokens, self.corpus_lengths
+        weight_lut = self.weight_arr[self.weight_dtype.categories.get_indexer(self.sign_vocab)]
+        
+        seq_id, totals, repeated_idx, is_high, hi_count = _sequence_kernel(codes, lengths, weight_lut, 2.5)
+        
+        # Look for numerical repetition patterns (possible quantity indicators):
+        # one row per repeated sign, grouped by sequence in corpus order
+        repeated_rows = seq_id[repeated_idx]
+        repeated_sequences = pd.DataFrame({
+            'sequence_row': repeated_rows,
+            'sequence': all_sequences[repeated_rows],
+            'repeated_sign': self.sign_vocab[codes[repeated_idx]]
+        })
+        match_rows = np.unique(repeated_rows)
+        
+        # Look for high-weight signs (authority/value indicators)
+        authority_rows = np.flatnonzero(hi_count)
+        structured_patterns = pd.DataFrame({
+            'sequence_row': authority_rows,
+            'sequence': all_sequences[authority_rows],
+            'high_weight_count': hi_count[authority_rows],
+            'total_weight': totals[authority_rows]
+        })
+        starts = np.cumsum(lengths) - lengths
         
         print(f"📊 PATTERN ANALYSIS RESULTS:")
-        print(f"   • Sequences with repetition: {len(repeated_sequences)}")
+        print(f"   • Sequences with repetition: {len(match_rows)}")
         print(f"   • Sequences with authority signs: {len(structured_patterns)}")
         
         # Show examples
         print(f"\n🔢 REPETITION PATTERNS (possible quantity markers):")
-        for i, pattern in enumerate(repeated_sequences[:5]):
-            print(f"   {i+1}. {pattern['sequence']}")
-            print(f"      Repeated: {pattern['repeated_signs']}")
+        examples = repeated_sequences[repeated_sequences['sequence_row'].isin(match_rows[:5])]
+        for i, (row, group) in enumerate(examples.groupby('sequence_row', sort=True)):
+            print(f"   {i+1}. {all_sequences[row]}")
+            print(f"      Repeated: {group['repeated_sign'].tolist()}")
         
         print(f"\n👑 AUTHORITY PATTERNS (possible value/ownership markers):")
-        for i, pattern in enumerate(sorted(structured_patterns, key=lambda x: x['total_weight'], reverse=True)[:5]):
-            print(f"   {i+1}. {pattern['sequence']}")
-            print(f"      High-weight signs: {pattern['high_weight_signs']}")
-            print(f"      Total weight: {pattern['total_weight']:.1f}")
-        
-        self.findings['repetition_patterns'] = len(repeated_sequences)
+        top_rows = heapq.nlargest(5, authority_rows.tolist(), key=totals.__getitem__)
+        for i, row in enumerate(top_rows):
+            span = slice(starts[row], starts[row] + lengths[row])
+            print(f"   {i+1}. {all_sequences[row]}")
+            print(f"      High-weight signs: {self.sign_vocab[codes[span][is_high[span]]].tolist()}")
+            print(f"      Total weight: {totals[row]:.1f}")
+        
+        self.findings['repetition_patterns'] = len(match_rows)
         self.findings['authority_patterns'] = len(structured_patterns)
         
         return repeated_sequences, structured_patterns
@@ -114,48 +338,25 @@ class TradeRitualInvestigator:
             print("⚠️ No translations available for content analysis")
             return
         
-        # Economic/trade terminology to look for
-        economic_terms = {
-            'quantity': ['three', 'many', 'all', 'some', 'few'],
-            'value': ['good', 'great', 'small', 'precious', 'valuable'],
-            'ownership': ['father', 'mother', 'king', 'person', 'house'],
-            'resources': ['grain', 'water', 'cattle', 'copper', 'land'],
-            'exchange': ['give', 'take', 'trade', 'exchange', 'market'],
-            'places': ['place', 'house', 'land', 'river', 'city'],
-            'actions': ['come', 'go', 'hold', 'stand', 'flow']
-        }
-        
-        content_analysis = defaultdict(list)
-        
-        for _, row in self.translations.iterrows():
-            translation = row['english_translation'].lower()
-            original = row['original_indus']
-            
-            for category, terms in economic_terms.items():
-                for term in terms:
-                    if term in translation:
-                        content_analysis[category].append({
-                            'original': original,
-                            'translation': translation,
-                            'term': term
-                        })
-                        break
+        scan = self._scan_translations()
+        content_analysis = scan['content_analysis']
+        originals = self.translations['original_indus'].to_numpy()
         
         print(f"📈 ECONOMIC CONTENT ANALYSIS:")
         for category, matches in content_analysis.items():
-            percentage = (len(matches) / len(self.translations)) * 100
-            print(f"   {category.upper():12}: {len(matches):3d} matches ({percentage:4.1f}%)")
+            percentage = (matches / len(self.translations)) * 100
+            print(f"   {category.upper():12}: {matches:3d} matches ({percentage:4.1f}%)")
         
         # Show examples of potential economic content
         print(f"\n💎 EXAMPLES OF POTENTIAL ECONOMIC CONTENT:")
         
         for category in ['quantity', 'value', 'resources', 'ownership']:
-            if category in content_analysis and content_analysis[category]:
+            if category in content_analysis:
                 print(f"\n   {category.upper()} INDICATORS:")
-                for i, example in enumerate(content_analysis[category][:3]):
-                    print(f"     {i+1}. {example['original']} → {example['translation']}")
+                for i, row in enumerate(scan['content_examples'][category]):
+                    print(f"     {i+1}. {originals[row]} → {self._lower[row]}")
         
-        self.findings['economic_content'] = {cat: len(matches) for cat, matches in content_analysis.items()}
+        self.findings['economic_content'] = {cat: int(matches) for cat, matches in content_analysis.items()}
         
         return content_analysis
     
@@ -171,27 +372,14 @@ class TradeRitualInvestigator:
             return
         
         # Look for patterns that combine ritual and economic elements
-        ritual_trade_combinations = []
-        
-        for _, row in self.translations.iterrows():
-            translation = row['english_translation'].lower()
-            original = row['original_indus']
-            
-            # Check for both ritual and economic terms in same inscription
-            has_ritual = any(term in translation for term in ['sacred', 'place', 'shine', 'pure', 'stand'])
-            has_economic = any(term in translation for term in ['grain', 'water', 'father', 'king', 'good', 'great'])
-            
-            if has_ritual and has_economic:
-                ritual_trade_combinations.append({
-                    'original': original,
-                    'translation': translation,
-                    'type': 'ritual_economic'
-                })
+        scan = self._scan_translations()
+        purity_counts = scan['purity_counts']
+        ritual_trade_combinations = scan['ritual_trade_combinations']
         
         print(f"🔗 RITUAL-ECONOMIC INTEGRATION ANALYSIS:")
         print(f"   • Total inscriptions: {len(self.translations)}")
-        print(f"   • Pure ritual only: {len([t for _, t in self.translations.iterrows() if 'sacred' in t['english_translation'].lower() and not any(term in t['english_translation'].lower() for term in ['grain', 'water', 'father', 'king'])])}")
-        print(f"   • Pure economic only: {len([t for _, t in self.translations.iterrows() if any(term in t['english_translation'].lower() for term in ['grain', 'water', 'father', 'king']) and 'sacred' not in t['english_translation'].lower()])}")
+        print(f"   • Pure ritual only: {purity_counts[1]}")
+        print(f"   • Pure economic only: {purity_counts[2]}")
         print(f"   • Ritual-economic combined: {len(ritual_trade_combinations)}")
         
         integration_percentage = (len(ritual_trade_combinations) / len(self.translations)) * 100
@@ -210,40 +398,20 @@ class TradeRitualInvestigator:
         print("\n🏺 COMPARING PHYSICAL VS SCRIPT EVIDENCE")
         print("=" * 40)
         
-        # Physical evidence of trade
-        physical_trade_evidence = {
-            'standardized_weights': True,
-            'uniform_brick_sizes': True,
-            'widespread_seals': True,
-            'long_distance_materials': True,
-            'port_facilities': True,
-            'storage_structures': True
-        }
-        
-        # Script evidence analysis
-        script_evidence = {
-            'explicit_quantities': False,  # No clear numerical records
-            'price_lists': False,          # No price information
-            'transaction_records': False,  # No clear transactions
-            'inventory_lists': False,      # No inventories
-            'trade_agreements': False,     # No contracts
-            'accounting_formulas': False   # No mathematical operations
-        }
-        
         print(f"📊 EVIDENCE COMPARISON:")
         print(f"\n   PHYSICAL ARCHAEOLOGICAL EVIDENCE:")
-        for evidence, present in physical_trade_evidence.items():
+        for evidence, present in _PHYSICAL_TRADE_EVIDENCE.items():
             status = "✅ PRESENT" if present else "❌ ABSENT"
             print(f"     {evidence.replace('_', ' ').title():20}: {status}")
         
         print(f"\n   SCRIPT CONTENT EVIDENCE:")
-        for evidence, present in script_evidence.items():
+        for evidence, present in _SCRIPT_EVIDENCE.items():
             status = "✅ PRESENT" if present else "❌ ABSENT"
             print(f"     {evidence.replace('_', ' ').title():20}: {status}")
         
         # Calculate mismatch
-        physical_score = sum(physical_trade_evidence.values())
-        script_score = sum(script_evidence.values())
+        physical_score = sum(_PHYSICAL_TRADE_EVIDENCE.values())
+        script_score = sum(_SCRIPT_EVIDENCE.values())
         
         print(f"\n🎯 EVIDENCE MISMATCH ANALYSIS:")
         print(f"   • Physical trade evidence: {physical_score}/6 ({physical_score/6*100:.0f}%)")
@@ -252,68 +420,14 @@ class TradeRitualInvestigator:
         
         self.findings['evidence_mismatch'] = abs(physical_score - script_score)
         
-        return physical_trade_evidence, script_evidence
+        return _PHYSICAL_TRADE_EVIDENCE, _SCRIPT_EVIDENCE
     
     def propose_resolution_models(self):
         """Propose models to resolve the trade-ritual paradox"""
         print("\n🧩 PROPOSED RESOLUTION MODELS")
         print("=" * 31)
         
-        models = {
-            'Model 1: Religious Control of Trade': {
-                'description': 'All trade was religiously controlled and recorded through ritual formulas',
-                'evidence_for': [
-                    'High ritual-economic integration rate',
-                    'Authority signs in trade-like sequences',
-                    'Standardized weights suggest central control'
-                ],
-                'evidence_against': [
-                    'No explicit quantities or prices',
-                    'Unclear transaction mechanisms'
-                ]
-            },
-            
-            'Model 2: Oral Accounting System': {
-                'description': 'Written script was purely ceremonial; actual accounting was oral/memory-based',
-                'evidence_for': [
-                    'Physical trade evidence without script records',
-                    'Small elite literacy suggests specialization',
-                    'Ritual script may have been status symbols only'
-                ],
-                'evidence_against': [
-                    'Difficult to maintain complex trade over 1000km',
-                    'No evidence of oral tradition preservation'
-                ]
-            },
-            
-            'Model 3: Missing Record Types': {
-                'description': 'Accounting was done on perishable materials (wood, palm leaves) not preserved',
-                'evidence_for': [
-                    'Durability bias in archaeological record',
-                    'Seals may have authenticated perishable documents',
-                    'Stone inscriptions may be only ceremonial subset'
-                ],
-                'evidence_against': [
-                    'No traces of perishable record systems',
-                    'Unclear why no clay tablets like Mesopotamia'
-                ]
-            },
-            
-            'Model 4: Token-Based Accounting': {
-                'description': 'Physical tokens/objects served as accounting tools, script was supplementary',
-                'evidence_for': [
-                    'Standardized weights as accounting tools',
-                    'Seals as authentication devices',
-                    'Physical control of trade goods'
-                ],
-                'evidence_against': [
-                    'Limited token archaeological evidence',
-                    'Unclear how complex transactions recorded'
-                ]
-            }
-        }
-        
-        for model_name, model_data in models.items():
+        for model_name, model_data in _RESOLUTION_MODELS.items():
             print(f"\n🏛️ {model_name.upper()}")
             print(f"   Description: {model_data['description']}")
             print(f"   Evidence FOR:")
@@ -323,7 +437,7 @@ class TradeRitualInvestigator:
             for evidence in model_data['evidence_against']:
                 print(f"     ❌ {evidence}")
         
-        return models
+        return _RESOLUTION_MODELS
     
     def generate_final_assessment(self):
         """Generate final assessment of the trade-ritual paradox"""
@@ -362,7 +476,7 @@ class TradeRitualInvestigator:
         }
         
         with open('output/trade_ritual_paradox_analysis.json', 'w') as f:
-            json.dump(detailed_report, f, indent=2)
+            f.write(json.dumps(detailed_report, indent=2))
         
         print(f"\n✅ Detailed analysis saved to output/trade_ritual_paradox_analysis.json")
 
@@ -7,154 +7,296 @@ Searches for ACTUAL evidence without imposing frameworks
 
 import pandas as pd
 import numpy as np
-from collections import defaultdict, Counter
+import pyarrow as pa
+import pyarrow.compute as pc
 import json
 import re
+import os
+import sys
+import hashlib
+import pickle
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Term lists scanned by the analyses; every check is a plain substring test
+# (`term in translation`), so e.g. 'all' also fires inside 'small'.
+_RELIGIOUS_TERMS = (
+    'sacred', 'holy', 'divine', 'god', 'goddess', 'temple', 'priest', 'worship',
+    'ritual', 'ceremony', 'blessing', 'prayer', 'offering', 'sacrifice'
+)
+
+_PRACTICAL_TERMS = (
+    'trade', 'sell', 'buy', 'price', 'cost', 'payment', 'exchange', 'market',
+    'store', 'warehouse', 'count', 'measure', 'weight', 'quantity', 'amount'
+)
+
+_ORGANIZATIONAL_TERMS = (
+    'agreement', 'contract', 'rule', 'law', 'permit', 'allow', 'authorize',
+    'certificate', 'document', 'record', 'register', 'official', 'formal'
+)
+
+_FAMILY_SOCIAL_TERMS = (
+    'father', 'mother', 'child', 'family', 'house', 'person', 'people',
+    'community', 'group', 'together', 'share', 'help', 'cooperate'
+)
+
+# Context clues around father/mother
+_AUTHORITY_CONTEXTS = (
+    'command', 'order', 'rule', 'control', 'authorize', 'permit', 'official',
+    'power', 'leader', 'chief', 'head', 'supreme', 'high', 'great'
+)
+
+_FAMILY_CONTEXTS = (
+    'child', 'son', 'daughter', 'home', 'family', 'love', 'care', 'help',
+    'together', 'share', 'give', 'take', 'come', 'go', 'house', 'live'
+)
+
+_EGALITARIAN_TERMS = (
+    'equal', 'same', 'share', 'together', 'all', 'everyone', 'common',
+    'fair', 'balance', 'cooperate', 'help', 'mutual', 'collective'
+)
+
+_PRACTICAL_ORGANIZATION_TERMS = (
+    'organize', 'plan', 'arrange', 'manage', 'coordinate', 'system',
+    'method', 'process', 'efficient', 'practical', 'useful', 'work'
+)
+
+_LIBERAL_TERMS = (
+    'open', 'free', 'choice', 'decide', 'choose', 'option', 'flexible',
+    'change', 'adapt', 'different', 'various', 'diverse', 'welcome'
+)
+
+# Religious words that may be forced where simpler interpretations exist
+_FORCED_RELIGIOUS_WORDS = ('blessing', 'sacred', 'divine', 'holy')
+_SECULAR_ALTERNATIVES = {
+    'blessing': ['approval', 'permission', 'agreement', 'validation'],
+    'sacred': ['important', 'special', 'designated', 'official'],
+    'divine': ['official', 'authorized', 'formal', 'important'],
+    'holy': ['special', 'important', 'designated', 'official']
+}
+
+# Every distinct term any analysis looks for, scanned together in one pass
+_ALL_TERMS = tuple(dict.fromkeys(
+    _RELIGIOUS_TERMS + _PRACTICAL_TERMS + _ORGANIZATIONAL_TERMS + _FAMILY_SOCIAL_TERMS +
+    _AUTHORITY_CONTEXTS + _FAMILY_CONTEXTS + _EGALITARIAN_TERMS +
+    _PRACTICAL_ORGANIZATION_TERMS + _LIBERAL_TERMS + _FORCED_RELIGIOUS_WORDS
+))
+_TERM_COL = {term: i for i, term in enumerate(_ALL_TERMS)}
+_ALL_TERMS_ARR = np.array(_ALL_TERMS, dtype=object)
+# Literal alternation: matches exactly when any term is a substring
+_ALL_TERMS_PATTERN = '|'.join(map(re.escape, _ALL_TERMS))
+
+# Opt-in on-disk memo of the term scan (INDUS_CACHE=1), keyed on translation content
+_SCAN_CACHE_VERSION = 3
+_SCAN_CACHE_DIR = Path.home() / '.cache' / 'indus'
+
+# Term -> category membership (terms may sit in several categories), one column per term list
+_CATEGORIES = (
+    _RELIGIOUS_TERMS, _PRACTICAL_TERMS, _ORGANIZATIONAL_TERMS, _FAMILY_SOCIAL_TERMS,
+    _AUTHORITY_CONTEXTS, _FAMILY_CONTEXTS, _EGALITARIAN_TERMS,
+    _PRACTICAL_ORGANIZATION_TERMS, _LIBERAL_TERMS, _FORCED_RELIGIOUS_WORDS
+)
+_CATEGORY_COL = {terms: j for j, terms in enumerate(_CATEGORIES)}
+_CATEGORY_SETS = tuple(frozenset(terms) for terms in _CATEGORIES)
+_CATEGORY_MEMBERSHIP = np.array([[term in terms for terms in _CATEGORY_SETS] for term in _ALL_TERMS], dtype=np.int64)
+
+def _tally(hits, membership):
+    """Per-category term-occurrence counts and per-row category flags.
+    
+    hits is the (rows x terms) bool hit matrix and membership the (terms x
+    categories) 0/1 matrix; both reductions are single matrix products.
+    """
+    counts = hits.sum(axis=0) @ membership
+    has_category = (hits @ membership) > 0
+    return counts, has_category
 
 class IndusRealityDetector:
     """Analyzes actual evidence for religious vs secular/pragmatic society"""
     
-    def __init__(self):
-        self.religious_indicators = []
-        self.secular_indicators = []
-        self.pragmatic_indicators = []
-        self.liberal_indicators = []
+    def __init__(self, verbose=True):
+        self.verbose = verbose
+        self._out = []
+        self._scan_cache = None
         
     def load_all_data(self):
         """Load all available data sources"""
-        print("📚 LOADING ALL EVIDENCE SOURCES")
-        print("=" * 32)
+        self._out.append("📚 LOADING ALL EVIDENCE SOURCES")
+        self._out.append("=" * 32)
         
         try:
-            self.translations = pd.read_csv('output/corrected_translations.tsv', sep='\t')
-            print(f"✓ Translations: {len(self.translations)} records")
+            self.translations = pd.read_csv('output/corrected_translations.tsv', sep='\t', engine='pyarrow',
+                                            usecols=['original_indus', 'english_translation'],
+                                            dtype={'original_indus': 'string[pyarrow]',
+                                                   'english_translation': 'string[pyarrow]'})
+            self._scan_cache = None
+            self._out.append(f"✓ Translations: {len(self.translations)} records")
         except:
-            print("❌ No translations found")
+            self._out.append("❌ No translations found")
+            self._flush()
             return False
         
         try:
             self.corpus = pd.read_csv('data/corpus.tsv', sep='\t', names=['id', 'sequence'])
-            print(f"✓ Corpus: {len(self.corpus)} sequences")
+            self._out.append(f"✓ Corpus: {len(self.corpus)} sequences")
         except:
-            print("❌ No corpus found")
+            self._out.append("❌ No corpus found")
         
         try:
-            self.ledger = pd.read_csv('data/ledger_en.tsv', sep='\t')
-            print(f"✓ Ledger: {len(self.ledger)} entries")
+            self.ledger = pd.read_csv('data/ledger_en.tsv', sep='\t', engine='pyarrow')
+            self._out.append(f"✓ Ledger: {len(self.ledger)} entries")
         except:
-            print("❌ No ledger found")
+            self._out.append("❌ No ledger found")
         
         try:
             with open('data/weights.json', 'r') as f:
                 self.weights = json.load(f)
-            print(f"✓ Sign weights: {len(self.weights)} signs")
+            self._out.append(f"✓ Sign weights: {len(self.weights)} signs")
         except:
-            print("❌ No weights found")
+            self._out.append("❌ No weights found")
         
+        self._flush()
         return True
     
-    def analyze_actual_content_without_bias(self):
-        """Analyze what the translations ACTUALLY say, without religious assumptions"""
-        print(f"\n🔍 UNBIASED CONTENT ANALYSIS")
-        print("=" * 27)
-        
-        # Look for ACTUAL religious terms vs practical terms
-        actual_religious_terms = [
-            'sacred', 'holy', 'divine', 'god', 'goddess', 'temple', 'priest', 'worship', 
-            'ritual', 'ceremony', 'blessing', 'prayer', 'offering', 'sacrifice'
-        ]
-        
-        actual_practical_terms = [
-            'trade', 'sell', 'buy', 'price', 'cost', 'payment', 'exchange', 'market',
-            'store', 'warehouse', 'count', 'measure', 'weight', 'quantity', 'amount'
-        ]
-        
-        organizational_terms = [
-            'agreement', 'contract', 'rule', 'law', 'permit', 'allow', 'authorize',
-            'certificate', 'document', 'record', 'register', 'official', 'formal'
-        ]
-        
-        family_social_terms = [
-            'father', 'mother', 'child', 'family', 'house', 'person', 'people',
-            'community', 'group', 'together', 'share', 'help', 'cooperate'
-        ]
-        
-        # Count actual occurrences
-        religious_count = 0
-        practical_count = 0
-        organizational_count = 0
-        family_social_count = 0
-        
-        religious_examples = []
-        practical_examples = []
-        organizational_examples = []
-        family_examples = []
-        
-        for _, row in self.translations.iterrows():
-            translation = row['english_translation'].lower()
-            original = row['original_indus']
+    def _flush(self):
+        """Write the queued report lines in one go (dropped when not verbose)"""
+        if self.verbose and self._out:
+            sys.stdout.write('\n'.join(self._out) + '\n')
+        self._out.clear()
+    
+    def _scan_cache_path(self):
+        """Cache file for the term scan, keyed on translation content and the term vocabulary"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((_SCAN_CACHE_VERSION, _ALL_TERMS, _CATEGORIES)).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(self.translations, index=False).to_numpy().tobytes())
+        return _SCAN_CACHE_DIR / f'truth_{digest.hexdigest()}.pkl'
+    
+    def _scan_all(self):
+        """Scan every translation for every known term in one pass (cached until reload).
+        
+        Returns the translations and the originals (kept as Arrow arrays;
+        _examples materializes and lowercases only the rows it selects), a
+        (translations x _ALL_TERMS) bool matrix of `term in translation.lower()`
+        hits that all analyses share, and its per-category tally (see _tally).
+        Matching is case-insensitive in the Arrow kernels, so the full column
+        is never lowercased.
+        """
+        if self._scan_cache is not None:
+            return self._scan_cache
+        
+        cache_path = self._scan_cache_path() if os.environ.get('INDUS_CACHE') == '1' else None
+        if cache_path is not None and cache_path.exists():
+            with open(cache_path, 'rb') as f:
+                self._scan_cache = pickle.load(f)
+        else:
+            translations = self.translations['english_translation']
             
-            # Check for actual religious content
-            found_religious = [term for term in actual_religious_terms if term in translation]
-            if found_religious:
-                religious_count += len(found_religious)
-                religious_examples.append({
-                    'original': original,
-                    'translation': translation,
-                    'religious_terms': found_religious
-                })
+            # Scan each distinct translation once; the trailing all-False row
+            # is what missing translations (code -1) pick up
+            codes, distinct = pd.factorize(translations)
+            # An Arrow string array is one contiguous UTF-8 buffer plus an offsets
+            # array, so each kernel below is a single pass over packed text
+            haystack = pa.array(distinct, type=pa.string())
             
-            # Check for practical/commercial content
-            found_practical = [term for term in actual_practical_terms if term in translation]
-            if found_practical:
-                practical_count += len(found_practical)
-                practical_examples.append({
-                    'original': original,
-                    'translation': translation,
-                    'practical_terms': found_practical
-                })
+            # Translations containing none of the terms need no per-term breakdown
+            prefilter = pc.match_substring_regex(haystack, _ALL_TERMS_PATTERN, ignore_case=True)
+            rows = np.flatnonzero(prefilter.to_numpy(zero_copy_only=False))
+            matched = pc.filter(haystack, prefilter)
+            distinct_hits = np.zeros((len(distinct) + 1, len(_ALL_TERMS)), dtype=bool)
             
-            # Check for organizational content
-            found_organizational = [term for term in organizational_terms if term in translation]
-            if found_organizational:
-                organizational_count += len(found_organizational)
-                organizational_examples.append({
-                    'original': original,
-                    'translation': translation,
-                    'organizational_terms': found_organizational
-                })
+            # Term columns are independent and the Arrow kernels release the GIL
+            with ThreadPoolExecutor() as pool:
+                columns = pool.map(
+                    lambda term: pc.match_substring(matched, term, ignore_case=True).to_numpy(zero_copy_only=False), _ALL_TERMS)
+                for col, column in enumerate(columns):
+                    distinct_hits[rows, col] = column
+            hits = distinct_hits[codes]
+            category_counts, has_category = _tally(hits, _CATEGORY_MEMBERSHIP)
             
-            # Check for family/social content
-            found_family = [term for term in family_social_terms if term in translation]
-            if found_family:
-                family_social_count += len(found_family)
-                family_examples.append({
-                    'original': original,
-                    'translation': translation,
-                    'family_terms': found_family
-                })
-        
-        print(f"📊 ACTUAL CONTENT ANALYSIS RESULTS:")
-        print(f"   🏛️ Religious terms: {religious_count} occurrences")
-        print(f"   💼 Practical/Commercial terms: {practical_count} occurrences")
-        print(f"   📋 Organizational terms: {organizational_count} occurrences")
-        print(f"   👨‍👩‍👧‍👦 Family/Social terms: {family_social_count} occurrences")
-        
-        print(f"\n🔍 ACTUAL RELIGIOUS EXAMPLES:")
-        for i, example in enumerate(religious_examples[:5]):
-            print(f"   {i+1}. {example['original']} → {example['translation']}")
-            print(f"      Religious terms: {example['religious_terms']}")
-        
-        print(f"\n💼 ACTUAL PRACTICAL EXAMPLES:")
-        for i, example in enumerate(practical_examples[:5]):
-            print(f"   {i+1}. {example['original']} → {example['translation']}")
-            print(f"      Practical terms: {example['practical_terms']}")
-        
-        print(f"\n👨‍👩‍👧‍👦 FAMILY/SOCIAL EXAMPLES (Top 5):")
-        for i, example in enumerate(family_examples[:5]):
-            print(f"   {i+1}. {example['original']} → {example['translation']}")
-            print(f"      Family terms: {example['family_terms']}")
-        
+            self._scan_cache = {
+                'translations': translations.array,
+                'originals': self.translations['original_indus'].array,
+                'hits': hits,
+                'category_counts': category_counts,
+                'has_category': has_category
+            }
+            if cache_path is not None:
+                try:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    with open(cache_path, 'wb') as f:
+                        pickle.dump(self._scan_cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+                except OSError:
+                    pass  # Cache is best-effort
+        return self._scan_cache
+    
+    def _term_hits(self, terms):
+        """Hit-matrix columns for the given terms, in the order given"""
+        return self._scan_all()['hits'][:, [_TERM_COL[term] for term in terms]]
+    
+    def _examples(self, mask, limit=None):
+        """Masked translations as an (original, lowercased translation) frame indexed by row.
+        
+        With a limit only the first `limit` matches are materialized.
+        """
+        scan = self._scan_all()
+        rows = np.flatnonzero(mask)[:limit]
+        return pd.DataFrame({
+            'original': scan['originals'].take(rows).to_numpy(),
+            'translation': pc.utf8_lower(pa.array(scan['translations'].take(rows))).to_numpy(zero_copy_only=False)
+        }, index=rows)
+    
+    def _matched_terms(self, row, terms):
+        """Which of the given terms one translation contains, in list order"""
+        row_terms = frozenset(_ALL_TERMS_ARR[self._scan_all()['hits'][row]])
+        return [term for term in terms if term in row_terms]
+    
+    def _has_category(self, terms):
+        """Rows containing any term of the given category term list"""
+        return self._scan_all()['has_category'][:, _CATEGORY_COL[terms]]
+    
+    def _count(self, terms):
+        """Total occurrences of a category's terms across all translations"""
+        return int(self._scan_all()['category_counts'][_CATEGORY_COL[terms]])
+    
+    def _scan(self, terms, limit=None):
+        """Count term occurrences and select the matching translations as examples"""
+        return self._count(terms), self._examples(self._has_category(terms), limit)
+    
+    def analyze_actual_content_without_bias(self):
+        """Analyze what the translations ACTUALLY say, without religious assumptions"""
+        self._out.append(f"\n🔍 UNBIASED CONTENT ANALYSIS")
+        self._out.append("=" * 27)
+        
+        # Count ACTUAL religious terms vs practical terms
+        religious_count, religious_examples = self._scan(_RELIGIOUS_TERMS)
+        practical_count, practical_examples = self._scan(_PRACTICAL_TERMS)
+        organizational_count = self._count(_ORGANIZATIONAL_TERMS)
+        family_social_count, family_examples = self._scan(_FAMILY_SOCIAL_TERMS)
+        
+        self._out.append(f"📊 ACTUAL CONTENT ANALYSIS RESULTS:")
+        self._out.append(f"   🏛️ Religious terms: {religious_count} occurrences")
+        self._out.append(f"   💼 Practical/Commercial terms: {practical_count} occurrences")
+        self._out.append(f"   📋 Organizational terms: {organizational_count} occurrences")
+        self._out.append(f"   👨‍👩‍👧‍👦 Family/Social terms: {family_social_count} occurrences")
+        
+        self._out.append(f"\n🔍 ACTUAL RELIGIOUS EXAMPLES:")
+        if self.verbose:
+            for i, (row, original, translation) in enumerate(religious_examples.head(5).itertuples(name=None)):
+                self._out.append(f"   {i+1}. {original} → {translation}")
+                self._out.append(f"      Religious terms: {self._matched_terms(row, _RELIGIOUS_TERMS)}")
+        
+        self._out.append(f"\n💼 ACTUAL PRACTICAL EXAMPLES:")
+        if self.verbose:
+            for i, (row, original, translation) in enumerate(practical_examples.head(5).itertuples(name=None)):
+                self._out.append(f"   {i+1}. {original} → {translation}")
+                self._out.append(f"      Practical terms: {self._matched_terms(row, _PRACTICAL_TERMS)}")
+        
+        self._out.append(f"\n👨‍👩‍👧‍👦 FAMILY/SOCIAL EXAMPLES (Top 5):")
+        if self.verbose:
+            for i, (row, original, translation) in enumerate(family_examples.head(5).itertuples(name=None)):
+                self._out.append(f"   {i+1}. {original} → {translation}")
+                self._out.append(f"      Family terms: {self._matched_terms(row, _FAMILY_SOCIAL_TERMS)}")
+        
+        self._flush()
         return {
             'religious_count': religious_count,
             'practical_count': practical_count,
@@ -167,95 +309,45 @@ class IndusRealityDetector:
     
     def test_authority_vs_family_interpretation(self):
         """Test if 'father/mother' are religious authorities OR just family references"""
-        print(f"\n👨‍👩‍👧‍👦 AUTHORITY VS FAMILY ANALYSIS")
-        print("=" * 31)
-        
-        # Look for context clues around father/mother
-        authority_contexts = [
-            'command', 'order', 'rule', 'control', 'authorize', 'permit', 'official',
-            'power', 'leader', 'chief', 'head', 'supreme', 'high', 'great'
-        ]
-        
-        family_contexts = [
-            'child', 'son', 'daughter', 'home', 'family', 'love', 'care', 'help',
-            'together', 'share', 'give', 'take', 'come', 'go', 'house', 'live'
-        ]
-        
-        father_authority = 0
-        father_family = 0
-        mother_authority = 0
-        mother_family = 0
-        
-        father_authority_examples = []
-        father_family_examples = []
-        mother_authority_examples = []
-        mother_family_examples = []
-        
-        for _, row in self.translations.iterrows():
-            translation = row['english_translation'].lower()
-            original = row['original_indus']
-            
-            if 'father' in translation:
-                # Check context
-                has_authority_context = any(term in translation for term in authority_contexts)
-                has_family_context = any(term in translation for term in family_contexts)
-                
-                if has_authority_context:
-                    father_authority += 1
-                    father_authority_examples.append({
-                        'original': original,
-                        'translation': translation,
-                        'authority_clues': [term for term in authority_contexts if term in translation]
-                    })
-                
-                if has_family_context:
-                    father_family += 1
-                    father_family_examples.append({
-                        'original': original,
-                        'translation': translation,
-                        'family_clues': [term for term in family_contexts if term in translation]
-                    })
-            
-            if 'mother' in translation:
-                # Check context
-                has_authority_context = any(term in translation for term in authority_contexts)
-                has_family_context = any(term in translation for term in family_contexts)
-                
-                if has_authority_context:
-                    mother_authority += 1
-                    mother_authority_examples.append({
-                        'original': original,
-                        'translation': translation,
-                        'authority_clues': [term for term in authority_contexts if term in translation]
-                    })
-                
-                if has_family_context:
-                    mother_family += 1
-                    mother_family_examples.append({
-                        'original': original,
-                        'translation': translation,
-                        'family_clues': [term for term in family_contexts if term in translation]
-                    })
-        
-        print(f"📊 FATHER CONTEXT ANALYSIS:")
-        print(f"   Authority context: {father_authority} instances")
-        print(f"   Family context: {father_family} instances")
-        print(f"   Ratio (Authority/Family): {father_authority/father_family if father_family > 0 else 'N/A'}")
-        
-        print(f"\n📊 MOTHER CONTEXT ANALYSIS:")
-        print(f"   Authority context: {mother_authority} instances")
-        print(f"   Family context: {mother_family} instances")
-        print(f"   Ratio (Authority/Family): {mother_authority/mother_family if mother_family > 0 else 'N/A'}")
-        
-        print(f"\n👨‍💼 FATHER AS AUTHORITY EXAMPLES:")
-        for i, example in enumerate(father_authority_examples[:3]):
-            print(f"   {i+1}. {example['original']} → {example['translation']}")
-            print(f"      Authority clues: {example['authority_clues']}")
-        
-        print(f"\n👨‍👧‍👦 FATHER AS FAMILY EXAMPLES:")
-        for i, example in enumerate(father_family_examples[:3]):
-            print(f"   {i+1}. {example['original']} → {example['translation']}")
-            print(f"      Family clues: {example['family_clues']}")
+        self._out.append(f"\n👨‍👩‍👧‍👦 AUTHORITY VS FAMILY ANALYSIS")
+        self._out.append("=" * 31)
+        
+        has_authority_context = self._has_category(_AUTHORITY_CONTEXTS)
+        has_family_context = self._has_category(_FAMILY_CONTEXTS)
+        
+        # Check context around each reference
+        has_father, has_mother = self._term_hits(['father', 'mother']).T
+        
+        father_authority = int((has_father & has_authority_context).sum())
+        father_family = int((has_father & has_family_context).sum())
+        mother_authority = int((has_mother & has_authority_context).sum())
+        mother_family = int((has_mother & has_family_context).sum())
+        
+        # Only the first three father examples of each kind are ever shown
+        father_authority_examples = self._examples(has_father & has_authority_context, limit=3)
+        father_family_examples = self._examples(has_father & has_family_context, limit=3)
+        
+        self._out.append(f"📊 FATHER CONTEXT ANALYSIS:")
+        self._out.append(f"   Authority context: {father_authority} instances")
+        self._out.append(f"   Family context: {father_family} instances")
+        self._out.append(f"   Ratio (Authority/Family): {father_authority/father_family if father_family > 0 else 'N/A'}")
+        
+        self._out.append(f"\n📊 MOTHER CONTEXT ANALYSIS:")
+        self._out.append(f"   Authority context: {mother_authority} instances")
+        self._out.append(f"   Family context: {mother_family} instances")
+        self._out.append(f"   Ratio (Authority/Family): {mother_authority/mother_family if mother_family > 0 else 'N/A'}")
+        
+        self._out.append(f"\n👨‍💼 FATHER AS AUTHORITY EXAMPLES:")
+        if self.verbose:
+            for i, (row, original, translation) in enumerate(father_authority_examples.head(3).itertuples(name=None)):
+                self._out.append(f"   {i+1}. {original} → {translation}")
+                self._out.append(f"      Authority clues: {self._matched_terms(row, _AUTHORITY_CONTEXTS)}")
+        
+        self._out.append(f"\n👨‍👧‍👦 FATHER AS FAMILY EXAMPLES:")
+        if self.verbose:
+            for i, (row, original, translation) in enumerate(father_family_examples.head(3).itertuples(name=None)):
+                self._out.append(f"   {i+1}. {original} → {translation}")
+                self._out.append(f"      Family clues: {self._matched_terms(row, _FAMILY_CONTEXTS)}")
         
         # Determine interpretation
         total_father = father_authority + father_family
@@ -271,7 +363,7 @@ class IndusRealityDetector:
         else:
             mother_authority_ratio = 0
         
-        print(f"\n🎯 INTERPRETATION VERDICT:")
+        self._out.append(f"\n🎯 INTERPRETATION VERDICT:")
         if father_authority_ratio > 0.7:
             father_interpretation = "AUTHORITY/OFFICIAL"
         elif father_authority_ratio > 0.3:
@@ -286,9 +378,10 @@ class IndusRealityDetector:
         else:
             mother_interpretation = "FAMILY/PERSONAL"
         
-        print(f"   Father interpretation: {father_interpretation}")
-        print(f"   Mother interpretation: {mother_interpretation}")
+        self._out.append(f"   Father interpretation: {father_interpretation}")
+        self._out.append(f"   Mother interpretation: {mother_interpretation}")
         
+        self._flush()
         return {
             'father_authority_ratio': father_authority_ratio,
             'mother_authority_ratio': mother_authority_ratio,
@@ -298,84 +391,31 @@ class IndusRealityDetector:
     
     def analyze_liberal_pragmatic_indicators(self):
         """Look for evidence of liberal, pragmatic, egalitarian society"""
-        print(f"\n🌟 LIBERAL/PRAGMATIC SOCIETY INDICATORS")
-        print("=" * 35)
-        
-        # Look for egalitarian indicators
-        egalitarian_terms = [
-            'equal', 'same', 'share', 'together', 'all', 'everyone', 'common',
-            'fair', 'balance', 'cooperate', 'help', 'mutual', 'collective'
-        ]
-        
-        # Look for practical organization
-        practical_organization = [
-            'organize', 'plan', 'arrange', 'manage', 'coordinate', 'system',
-            'method', 'process', 'efficient', 'practical', 'useful', 'work'
-        ]
-        
-        # Look for liberal/open indicators
-        liberal_terms = [
-            'open', 'free', 'choice', 'decide', 'choose', 'option', 'flexible',
-            'change', 'adapt', 'different', 'various', 'diverse', 'welcome'
-        ]
-        
-        egalitarian_count = 0
-        practical_count = 0
-        liberal_count = 0
-        
-        egalitarian_examples = []
-        practical_examples = []
-        liberal_examples = []
-        
-        for _, row in self.translations.iterrows():
-            translation = row['english_translation'].lower()
-            original = row['original_indus']
-            
-            # Check for egalitarian content
-            found_egalitarian = [term for term in egalitarian_terms if term in translation]
-            if found_egalitarian:
-                egalitarian_count += len(found_egalitarian)
-                egalitarian_examples.append({
-                    'original': original,
-                    'translation': translation,
-                    'egalitarian_terms': found_egalitarian
-                })
-            
-            # Check for practical organization
-            found_practical = [term for term in practical_organization if term in translation]
-            if found_practical:
-                practical_count += len(found_practical)
-                practical_examples.append({
-                    'original': original,
-                    'translation': translation,
-                    'practical_terms': found_practical
-                })
-            
-            # Check for liberal indicators
-            found_liberal = [term for term in liberal_terms if term in translation]
-            if found_liberal:
-                liberal_count += len(found_liberal)
-                liberal_examples.append({
-                    'original': original,
-                    'translation': translation,
-                    'liberal_terms': found_liberal
-                })
-        
-        print(f"📊 LIBERAL/PRAGMATIC INDICATORS:")
-        print(f"   🤝 Egalitarian terms: {egalitarian_count} occurrences")
-        print(f"   🔧 Practical organization: {practical_count} occurrences")
-        print(f"   🆓 Liberal/Open terms: {liberal_count} occurrences")
-        
-        print(f"\n🤝 EGALITARIAN EXAMPLES:")
-        for i, example in enumerate(egalitarian_examples[:3]):
-            print(f"   {i+1}. {example['original']} → {example['translation']}")
-            print(f"      Egalitarian terms: {example['egalitarian_terms']}")
-        
-        print(f"\n🔧 PRACTICAL ORGANIZATION EXAMPLES:")
-        for i, example in enumerate(practical_examples[:3]):
-            print(f"   {i+1}. {example['original']} → {example['translation']}")
-            print(f"      Practical terms: {example['practical_terms']}")
-        
+        self._out.append(f"\n🌟 LIBERAL/PRAGMATIC SOCIETY INDICATORS")
+        self._out.append("=" * 35)
+        
+        egalitarian_count, egalitarian_examples = self._scan(_EGALITARIAN_TERMS, limit=3)
+        practical_count, practical_examples = self._scan(_PRACTICAL_ORGANIZATION_TERMS, limit=3)
+        liberal_count = self._count(_LIBERAL_TERMS)
+        
+        self._out.append(f"📊 LIBERAL/PRAGMATIC INDICATORS:")
+        self._out.append(f"   🤝 Egalitarian terms: {egalitarian_count} occurrences")
+        self._out.append(f"   🔧 Practical organization: {practical_count} occurrences")
+        self._out.append(f"   🆓 Liberal/Open terms: {liberal_count} occurrences")
+        
+        self._out.append(f"\n🤝 EGALITARIAN EXAMPLES:")
+        if self.verbose:
+            for i, (row, original, translation) in enumerate(egalitarian_examples.head(3).itertuples(name=None)):
+                self._out.append(f"   {i+1}. {original} → {translation}")
+                self._out.append(f"      Egalitarian terms: {self._matched_terms(row, _EGALITARIAN_TERMS)}")
+        
+        self._out.append(f"\n🔧 PRACTICAL ORGANIZATION EXAMPLES:")
+        if self.verbose:
+            for i, (row, original, translation) in enumerate(practical_examples.head(3).itertuples(name=None)):
+                self._out.append(f"   {i+1}. {original} → {translation}")
+                self._out.append(f"      Practical terms: {self._matched_terms(row, _PRACTICAL_ORGANIZATION_TERMS)}")
+        
+        self._flush()
         return {
             'egalitarian_count': egalitarian_count,
             'practical_count': practical_count,
@@ -384,71 +424,55 @@ class IndusRealityDetector:
     
     def critical_translation_verification(self):
         """Critically examine if our translations are forcing religious interpretations"""
-        print(f"\n🔍 CRITICAL TRANSLATION VERIFICATION")
-        print("=" * 33)
-        
-        # Check if we're forcing "blessing", "sacred", "divine" where simpler interpretations exist
-        suspected_forced_religious = []
+        self._out.append(f"\n🔍 CRITICAL TRANSLATION VERIFICATION")
+        self._out.append("=" * 33)
         
         # Look for translations that might be forcing religious language
-        for _, row in self.translations.iterrows():
-            translation = row['english_translation'].lower()
-            original = row['original_indus']
-            
-            # Check for potentially forced religious interpretations
-            religious_words = ['blessing', 'sacred', 'divine', 'holy']
-            secular_alternatives = {
-                'blessing': ['approval', 'permission', 'agreement', 'validation'],
-                'sacred': ['important', 'special', 'designated', 'official'],
-                'divine': ['official', 'authorized', 'formal', 'important'],
-                'holy': ['special', 'important', 'designated', 'official']
-            }
-            
-            found_religious = [word for word in religious_words if word in translation]
-            if found_religious:
-                suspected_forced_religious.append({
-                    'original': original,
-                    'translation': translation,
-                    'religious_words': found_religious,
-                    'possible_secular_alternatives': [secular_alternatives.get(word, []) for word in found_religious]
-                })
-        
-        print(f"⚠️ POTENTIALLY FORCED RELIGIOUS INTERPRETATIONS:")
-        print(f"   Found {len(suspected_forced_religious)} cases")
-        
-        for i, case in enumerate(suspected_forced_religious[:5]):
-            print(f"\n   {i+1}. {case['original']} → {case['translation']}")
-            print(f"      Religious words used: {case['religious_words']}")
-            for j, word in enumerate(case['religious_words']):
-                alternatives = secular_alternatives.get(word, [])
-                print(f"      '{word}' could be: {', '.join(alternatives)}")
+        _, suspected_forced_religious = self._scan(_FORCED_RELIGIOUS_WORDS)
+        
+        self._out.append(f"⚠️ POTENTIALLY FORCED RELIGIOUS INTERPRETATIONS:")
+        self._out.append(f"   Found {len(suspected_forced_religious)} cases")
+        
+        if self.verbose:
+            for i, (row, original, translation) in enumerate(suspected_forced_religious.head(5).itertuples(name=None)):
+                religious_words = self._matched_terms(row, _FORCED_RELIGIOUS_WORDS)
+                self._out.append(f"\n   {i+1}. {original} → {translation}")
+                self._out.append(f"      Religious words used: {religious_words}")
+                for j, word in enumerate(religious_words):
+                    alternatives = _SECULAR_ALTERNATIVES.get(word, [])
+                    self._out.append(f"      '{word}' could be: {', '.join(alternatives)}")
         
+        self._flush()
         return suspected_forced_religious
     
     def generate_truth_assessment(self, content_analysis, authority_analysis, liberal_analysis, forced_religious):
         """Generate honest assessment of what the evidence actually shows"""
-        print(f"\n🎯 TRUTH ASSESSMENT")
-        print("=" * 17)
+        self._out.append(f"\n🎯 TRUTH ASSESSMENT")
+        self._out.append("=" * 17)
         
         # Calculate evidence weights
         total_translations = len(self.translations)
         
-        religious_percentage = (content_analysis['religious_count'] / total_translations) * 100 if total_translations > 0 else 0
-        practical_percentage = (content_analysis['practical_count'] / total_translations) * 100 if total_translations > 0 else 0
-        family_percentage = (content_analysis['family_social_count'] / total_translations) * 100 if total_translations > 0 else 0
+        # All three shares in one vectorized divide (0 when there are no translations)
+        percentages = np.zeros(3)
+        np.divide([content_analysis['religious_count'], content_analysis['practical_count'],
+                   content_analysis['family_social_count']], total_translations,
+                  out=percentages, where=total_translations > 0)
+        percentages *= 100
+        religious_percentage, practical_percentage, family_percentage = percentages.tolist()
         
-        print(f"📊 EVIDENCE BREAKDOWN:")
-        print(f"   🏛️ Actual religious content: {religious_percentage:.1f}%")
-        print(f"   💼 Practical/commercial content: {practical_percentage:.1f}%")
-        print(f"   👨‍👩‍👧‍👦 Family/social content: {family_percentage:.1f}%")
-        print(f"   ⚠️ Potentially forced religious interpretations: {len(forced_religious)}")
+        self._out.append(f"📊 EVIDENCE BREAKDOWN:")
+        self._out.append(f"   🏛️ Actual religious content: {religious_percentage:.1f}%")
+        self._out.append(f"   💼 Practical/commercial content: {practical_percentage:.1f}%")
+        self._out.append(f"   👨‍👩‍👧‍👦 Family/social content: {family_percentage:.1f}%")
+        self._out.append(f"   ⚠️ Potentially forced religious interpretations: {len(forced_religious)}")
         
-        print(f"\n🔍 AUTHORITY VS FAMILY ANALYSIS:")
-        print(f"   Father as authority: {authority_analysis['father_interpretation']}")
-        print(f"   Mother as authority: {authority_analysis['mother_interpretation']}")
+        self._out.append(f"\n🔍 AUTHORITY VS FAMILY ANALYSIS:")
+        self._out.append(f"   Father as authority: {authority_analysis['father_interpretation']}")
+        self._out.append(f"   Mother as authority: {authority_analysis['mother_interpretation']}")
         
         # Generate honest verdict
-        print(f"\n⚖️ HONEST VERDICT:")
+        self._out.append(f"\n⚖️ HONEST VERDICT:")
         
         if religious_percentage < 5 and len(forced_religious) > 10:
             verdict = "LIKELY SECULAR/PRAGMATIC"
@@ -467,28 +491,29 @@ class IndusRealityDetector:
             confidence = "LOW"
             explanation = "Evidence is mixed or unclear. Further analysis needed."
         
-        print(f"   🎯 Most likely reality: {verdict}")
-        print(f"   🎲 Confidence level: {confidence}")
-        print(f"   💡 Explanation: {explanation}")
+        self._out.append(f"   🎯 Most likely reality: {verdict}")
+        self._out.append(f"   🎲 Confidence level: {confidence}")
+        self._out.append(f"   💡 Explanation: {explanation}")
         
         # Specific challenges to my earlier interpretation
-        print(f"\n🚨 CHALLENGES TO PREVIOUS 'SACRED-ECONOMY' INTERPRETATION:")
+        self._out.append(f"\n🚨 CHALLENGES TO PREVIOUS 'SACRED-ECONOMY' INTERPRETATION:")
         
         if religious_percentage < 10:
-            print(f"   ❌ Only {religious_percentage:.1f}% actual religious content - insufficient for 'sacred economy'")
+            self._out.append(f"   ❌ Only {religious_percentage:.1f}% actual religious content - insufficient for 'sacred economy'")
         
         if len(forced_religious) > 20:
-            print(f"   ❌ {len(forced_religious)} potentially forced religious interpretations - bias evident")
+            self._out.append(f"   ❌ {len(forced_religious)} potentially forced religious interpretations - bias evident")
         
         if family_percentage > religious_percentage * 3:
-            print(f"   ❌ Family content ({family_percentage:.1f}%) far exceeds religious ({religious_percentage:.1f}%) - suggests family organization")
+            self._out.append(f"   ❌ Family content ({family_percentage:.1f}%) far exceeds religious ({religious_percentage:.1f}%) - suggests family organization")
         
         if authority_analysis['father_interpretation'] == "FAMILY/PERSONAL":
-            print(f"   ❌ 'Father' appears to be family reference, not religious authority")
+            self._out.append(f"   ❌ 'Father' appears to be family reference, not religious authority")
         
         if practical_percentage > religious_percentage:
-            print(f"   ❌ Practical content ({practical_percentage:.1f}%) exceeds religious ({religious_percentage:.1f}%) - suggests pragmatic society")
+            self._out.append(f"   ❌ Practical content ({practical_percentage:.1f}%) exceeds religious ({religious_percentage:.1f}%) - suggests pragmatic society")
         
+        self._flush()
         return {
             'verdict': verdict,
             'confidence': confidence,
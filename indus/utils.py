@@ -2,6 +2,33 @@
 Utility functions for the Indus Valley decipherment project.
 """
 
+_REVOLUTIONARY_SUMMARY = """
+🚀 REVOLUTIONARY DISCOVERY: Indus Valley as Humanity's First Secular Democracy
+
+✅ 2,512 inscriptions deciphered (largest successful ancient script decipherment)
+✅ NO kings or royal hierarchy found
+✅ NO priests as separate class  
+✅ Family-based confederation governance
+✅ 1,000,000 people across 1.25 million km² for 2,000 years
+✅ 3.5:1 family-to-authority ratio in vocabulary
+✅ Only 0.9% religious content (secular society confirmed)
+✅ Peaceful trade network without military evidence
+✅ World's first continental-scale urban planning
+
+The Indus Valley achieved liberal democracy 4,000 years before the concept 
+was "invented" in modern times.
+""".strip()
+
+# Both canonical cases are stored so the usual callers skip the .upper() copy
+_EMOJI_MAP = {
+    'PASS': '✅',
+    'WARNING': '⚠️',
+    'FAIL': '❌',
+    'pass': '✅',
+    'warning': '⚠️',
+    'fail': '❌'
+}
+
 def pct(value: float, total: float) -> float:
     """
     Calculate percentage with proper handling of zero division.
@@ -13,9 +40,28 @@ def pct(value: float, total: float) -> float:
     Returns:
         Percentage (0-100)
     """
-    if total == 0:
-        return 0.0
-    return (value / total) * 100.0
+    return (value / total) * 100.0 if total else 0.0
+
+def pct_vec(values, totals):
+    """
+    Vectorized pct() over arrays of values and totals (zero totals give 0.0).
+    
+    Args:
+        values: The part values
+        totals: The total values (broadcast against values)
+        
+    Returns:
+        numpy array of percentages (0-100)
+    """
+    # numpy is only needed here; keep `import indus.utils` light for the CLI helpers
+    import numpy as np
+    
+    values, totals = np.broadcast_arrays(np.asarray(values, dtype=np.float64),
+                                         np.asarray(totals, dtype=np.float64))
+    out = np.zeros_like(values)
+    np.divide(values, totals, out=out, where=totals != 0)
+    out *= 100.0
+    return out
 
 def format_number(num: int) -> str:
     """
@@ -36,22 +82,7 @@ def revolutionary_summary() -> str:
     Returns:
         Summary string
     """
-    return """
-🚀 REVOLUTIONARY DISCOVERY: Indus Valley as Humanity's First Secular Democracy
-
-✅ 2,512 inscriptions deciphered (largest successful ancient script decipherment)
-✅ NO kings or royal hierarchy found
-✅ NO priests as separate class  
-✅ Family-based confederation governance
-✅ 1,000,000 people across 1.25 million km² for 2,000 years
-✅ 3.5:1 family-to-authority ratio in vocabulary
-✅ Only 0.9% religious content (secular society confirmed)
-✅ Peaceful trade network without military evidence
-✅ World's first continental-scale urban planning
-
-The Indus Valley achieved liberal democracy 4,000 years before the concept 
-was "invented" in modern times.
-    """.strip()
+    return _REVOLUTIONARY_SUMMARY
 
 def data_status_emoji(status: str) -> str:
     """
@@ -63,9 +94,4 @@ def data_status_emoji(status: str) -> str:
     Returns:
         Appropriate emoji
     """
-    emoji_map = {
-        'PASS': '✅',
-        'WARNING': '⚠️',
-        'FAIL': '❌'
-    }
-    return emoji_map.get(status.upper(), '❓') 
\ No newline at end of file
+    return _EMOJI_MAP.get(status) or _EMOJI_MAP.get(status.upper(), '❓') 
\ No newline at end of file
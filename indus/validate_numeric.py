@@ -10,142 +10,249 @@ import pandas as pd
 import numpy as np
 import json
 import argparse
+import os
+import sys
+import pyarrow as pa
+import pyarrow.parquet as pq
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+
+@lru_cache(maxsize=None)
+def _load_weights(weights_path):
+    """Parse weights.json once per path; read-only so validators can share it"""
+    with open(weights_path, 'rb') as f:
+        return MappingProxyType(json.loads(f.read()))
+
+# Corpus parse options shared by every validator, so they all agree on the Parquet copy.
+# Signs are read as the nullable 'string' dtype: a plain str cast turns missing cells into 'None'
+_CORPUS_CSV_OPTIONS = MappingProxyType({'sep': '\t', 'engine': 'pyarrow', 'dtype': {'signs': 'string'}})
+
+# Stripped sign sequences that count as invalid (missing values are treated as '')
+_INVALID_SIGNS = frozenset(('', 'nan'))
+
+# Rows per chunk when streaming the corpus signs column
+_CHUNK_ROWS = 200_000
+
+# Parquet schema metadata key holding the size/mtime stamp of the source text file
+_STAMP_KEY = b'indus_source'
+
+def _parquet_copy(path):
+    """Parquet copy kept next to a CSV/TSV when INDUS_CACHE=1: its path, the text file's stamp, and whether they match
+    
+    The copy records the size and mtime of the text file it was built from and
+    is only reused while both are unchanged; None when caching is off.
+    """
+    if os.environ.get('INDUS_CACHE') != '1':
+        return None
+    parquet_path = os.path.splitext(path)[0] + '.table.parquet'
+    st = os.stat(path)
+    stamp = f"{st.st_size}:{st.st_mtime_ns}".encode()
+    try:
+        fresh = (pq.read_schema(parquet_path).metadata or {}).get(_STAMP_KEY) == stamp
+    except (OSError, pa.ArrowException):
+        fresh = False  # Missing or unreadable copy is rebuilt
+    return parquet_path, stamp, fresh
+
+def _parse_corpus(path, **csv_options):
+    """Parse the corpus TSV, with polars' multi-threaded reader when INDUS_FAST_IO=1 and it is installed"""
+    if os.environ.get('INDUS_FAST_IO') == '1':
+        try:
+            import polars as pl
+        except ImportError:
+            pass  # Optional fast path; pandas below gives the same frame
+        else:
+            # pandas' default NA tokens ('', 'nan', 'NA', 'NULL', ...) are null here too
+            from pandas._libs.parsers import STR_NA_VALUES
+            
+            # All columns as text, so signs never go through numeric inference
+            return pl.read_csv(path, separator=csv_options.get('sep', ','), infer_schema_length=0,
+                               null_values=sorted(STR_NA_VALUES)).to_pandas()
+    return pd.read_csv(path, **csv_options)
+
+def _read_tabular(path, columns=None, parse=pd.read_csv, **csv_options):
+    """Read a CSV/TSV, via a Parquet copy next to it when INDUS_CACHE=1 (rebuilt whenever the text file changes)"""
+    copy = _parquet_copy(path)
+    if copy is not None and copy[2]:
+        return pd.read_parquet(copy[0], columns=columns)
+    
+    # The copy always holds every column; callers needing a subset only pay for it on later runs
+    df = parse(path, **csv_options)
+    if copy is not None:
+        parquet_path, stamp, _ = copy
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}), _STAMP_KEY: stamp})
+            pq.write_table(table, parquet_path, compression='zstd')
+        except (OSError, pa.ArrowException):
+            pass  # Copy is best-effort; an unwritable data dir or a mixed-type column just means re-parsing next run
+    return df if columns is None else df[columns]
+
+def _iter_signs(corpus_path, chunk_rows=_CHUNK_ROWS):
+    """Stream the corpus signs column in bounded chunks (from the Parquet copy when fresh)
+    
+    Missing signs come out as '' from either source, so the reports never
+    depend on whether the copy was fresh.
+    """
+    copy = _parquet_copy(corpus_path)
+    if copy is not None and copy[2]:
+        for batch in pq.ParquetFile(copy[0]).iter_batches(batch_size=chunk_rows, columns=['signs']):
+            yield batch.to_pandas()['signs'].fillna('').astype(str)
+    else:
+        for chunk in pd.read_csv(corpus_path, sep='\t', usecols=['signs'], dtype={'signs': str}, chunksize=chunk_rows):
+            yield chunk['signs'].fillna('').astype(str)
+
+def _segment_sums(values, lengths):
+    """Sum consecutive runs of the given lengths, adding left to right like Python's sum()"""
+    starts = np.cumsum(lengths) - lengths
+    # Longest runs first, so the runs still adding a k-th value are always a prefix of `order`
+    order = np.argsort(-lengths, kind='stable')
+    order_starts = starts[order]
+    at_least = np.cumsum(np.bincount(lengths, minlength=1)[::-1])[::-1]
+    
+    sums = np.zeros(len(lengths))
+    for k in range(1, len(at_least)):
+        live = at_least[k]
+        sums[order[:live]] += values[order_starts[:live] + (k - 1)]
+    return sums
+
+# Report lines queued by the validators and written in one go when each returns
+_out = []
+
+def _flush():
+    """Write the queued report lines with a single stdout write"""
+    if _out:
+        sys.stdout.write('\n'.join(_out) + '\n')
+        _out.clear()
 
 def validate_corpus_structure(corpus_path):
     """Validate corpus structure and integrity"""
-    print("🔍 VALIDATING CORPUS STRUCTURE")
-    print("=" * 35)
+    _out.append("🔍 VALIDATING CORPUS STRUCTURE")
+    _out.append("=" * 35)
     
-    df = pd.read_csv(corpus_path, sep='\t')
-    print(f"   📊 Loaded {len(df)} inscriptions")
+    # Every column is read: the check reports missing columns and nulls anywhere
+    df = _read_tabular(corpus_path, parse=_parse_corpus, **_CORPUS_CSV_OPTIONS)
+    _out.append(f"   📊 Loaded {len(df)} inscriptions")
     
     # Check required columns
     required_cols = ['id', 'signs', 'site', 'layer']
     missing_cols = [col for col in required_cols if col not in df.columns]
     
     if missing_cols:
-        print(f"   ❌ Missing columns: {missing_cols}")
+        _out.append(f"   ❌ Missing columns: {missing_cols}")
+        _flush()
         return False
     
-    # Validate data integrity
-    null_counts = df.isnull().sum()
-    if null_counts.sum() > 0:
-        print(f"   ⚠️ Null values found: {null_counts.to_dict()}")
+    # Validate data integrity (per-column counts are only needed for the warning)
+    null_mask = df.isnull()
+    if null_mask.to_numpy().any():
+        _out.append(f"   ⚠️ Null values found: {null_mask.sum().to_dict()}")
     
-    # Check sign format
-    invalid_signs = 0
-    for _, row in df.iterrows():
-        signs = str(row['signs']).strip()
-        if not signs or signs == 'nan':
-            invalid_signs += 1
+    # Check sign format (missing, blank or literal 'nan' sequences)
+    invalid_signs = int(df['signs'].fillna('').astype(str).str.strip().isin(_INVALID_SIGNS).sum())
     
     if invalid_signs > 0:
-        print(f"   ⚠️ Invalid sign sequences: {invalid_signs}")
+        _out.append(f"   ⚠️ Invalid sign sequences: {invalid_signs}")
     
-    print(f"   ✅ Corpus structure: VALID")
+    _out.append(f"   ✅ Corpus structure: VALID")
+    _flush()
     return True
 
 def validate_weights_consistency(weights_path, corpus_path):
     """Validate weight assignments and curvature optimization"""
-    print("\n🔍 VALIDATING WEIGHT CONSISTENCY")
-    print("=" * 35)
+    _out.append("\n🔍 VALIDATING WEIGHT CONSISTENCY")
+    _out.append("=" * 35)
     
     # Load weights
-    with open(weights_path, 'r') as f:
-        weights = json.load(f)
-    
-    print(f"   📊 Loaded {len(weights)} sign weights")
+    weights = _load_weights(weights_path)
     
-    # Load corpus to check sign coverage
-    df = pd.read_csv(corpus_path, sep='\t')
+    _out.append(f"   📊 Loaded {len(weights)} sign weights")
     
-    # Extract all unique signs from corpus
+    # Extract all unique signs from corpus, a chunk at a time
     all_signs = set()
-    for _, row in df.iterrows():
-        signs = str(row['signs']).split()
-        all_signs.update(signs)
+    for signs in _iter_signs(corpus_path):
+        all_signs.update(signs.str.split().explode().dropna())
     
     all_signs.discard('nan')
     all_signs.discard('')
     
-    # Check coverage
-    weight_signs = set(weights.keys())
-    corpus_signs = all_signs
-    
-    missing_weights = corpus_signs - weight_signs
-    unused_weights = weight_signs - corpus_signs
+    # Check coverage: one probe per corpus sign yields the missing set and the overlap,
+    # and the unused weights follow from the counts alone
+    missing_weights = {sign for sign in all_signs if sign not in weights}
+    covered = len(all_signs) - len(missing_weights)
+    unused_weights = len(weights) - covered
     
-    coverage = len(corpus_signs & weight_signs) / len(corpus_signs) * 100
+    coverage = covered / len(all_signs) * 100
     
-    print(f"   📈 Weight coverage: {coverage:.1f}%")
+    _out.append(f"   📈 Weight coverage: {coverage:.1f}%")
     
     if missing_weights:
-        print(f"   ⚠️ Signs without weights: {len(missing_weights)}")
+        _out.append(f"   ⚠️ Signs without weights: {len(missing_weights)}")
         if len(missing_weights) <= 5:
-            print(f"      {list(missing_weights)}")
+            _out.append(f"      {list(missing_weights)}")
     
     if unused_weights:
-        print(f"   ⚠️ Unused weight entries: {len(unused_weights)}")
+        _out.append(f"   ⚠️ Unused weight entries: {unused_weights}")
     
     # Validate weight distribution
     weight_values = list(weights.values())
-    print(f"   📊 Weight range: {min(weight_values):.2f} - {max(weight_values):.2f}")
-    print(f"   📊 Weight mean: {np.mean(weight_values):.2f}")
+    _out.append(f"   📊 Weight range: {min(weight_values):.2f} - {max(weight_values):.2f}")
+    _out.append(f"   📊 Weight mean: {np.mean(weight_values):.2f}")
     
-    print(f"   ✅ Weight consistency: VALID")
+    _out.append(f"   ✅ Weight consistency: VALID")
+    _flush()
     return True
 
 def validate_compounds(compounds_path, weights_path):
     """Validate compound signs against component weights"""
-    print("\n🔍 VALIDATING COMPOUND STRUCTURE")
-    print("=" * 35)
+    _out.append("\n🔍 VALIDATING COMPOUND STRUCTURE")
+    _out.append("=" * 35)
     
     try:
-        compounds_df = pd.read_csv(compounds_path)
-        print(f"   📊 Loaded {len(compounds_df)} compounds")
+        compounds_df = _read_tabular(compounds_path)
+        _out.append(f"   📊 Loaded {len(compounds_df)} compounds")
         
-        with open(weights_path, 'r') as f:
-            weights = json.load(f)
+        weights = _load_weights(weights_path)
         
-        violations = 0
+        # Check compound >= sum of parts rule (ids and components as their string form)
+        w = pd.Series(dict(weights), dtype='float64')
+        blank = pd.Series('', index=compounds_df.index, dtype=str)
+        compound_ids = compounds_df.get('compound_id', blank).astype(str)
+        components = compounds_df.get('components', blank).astype(str).str.split()
         
-        # Check compound >= sum of parts rule
-        for _, row in compounds_df.iterrows():
-            compound_id = str(row.get('compound_id', ''))
-            components = str(row.get('components', '')).split()
-            
-            if compound_id in weights and len(components) > 1:
-                compound_weight = weights[compound_id]
-                component_sum = sum(weights.get(comp, 0) for comp in components)
-                
-                if compound_weight < component_sum:
-                    violations += 1
-                    if violations <= 3:  # Show first few violations
-                        print(f"   ⚠️ Violation: {compound_id} ({compound_weight:.2f}) < sum({components}) ({component_sum:.2f})")
+        sizes = components.str.len().fillna(0).to_numpy(dtype=np.int64)
+        compound_weights = compound_ids.map(w).to_numpy()
+        component_sums = _segment_sums(components.explode().dropna().map(w).fillna(0.0).to_numpy(), sizes)
+        
+        # Unweighted compound ids map to NaN and never compare as violations
+        violating = np.flatnonzero((sizes > 1) & (compound_weights < component_sums))
+        violations = len(violating)
+        for row in violating[:3]:  # Show first few violations
+            _out.append(f"   ⚠️ Violation: {compound_ids.iat[row]} ({compound_weights[row]:.2f}) < sum({components.iat[row]}) ({component_sums[row]:.2f})")
         
         if violations == 0:
-            print(f"   ✅ Compound structure: VALID")
+            _out.append(f"   ✅ Compound structure: VALID")
         else:
-            print(f"   ❌ Compound violations: {violations}")
+            _out.append(f"   ❌ Compound violations: {violations}")
             
+        _flush()
         return violations == 0
         
     except FileNotFoundError:
-        print(f"   ⚠️ Compounds file not found, skipping validation")
+        _out.append(f"   ⚠️ Compounds file not found, skipping validation")
+        _flush()
         return True
 
 def validate_modifiers(modifiers_path, weights_path):
     """Validate modifier consistency"""
-    print("\n🔍 VALIDATING MODIFIER CONSISTENCY")
-    print("=" * 35)
+    _out.append("\n🔍 VALIDATING MODIFIER CONSISTENCY")
+    _out.append("=" * 35)
     
     try:
-        modifiers_df = pd.read_csv(modifiers_path)
-        print(f"   📊 Loaded {len(modifiers_df)} modifiers")
+        modifiers_df = _read_tabular(modifiers_path)
+        _out.append(f"   📊 Loaded {len(modifiers_df)} modifiers")
         
-        with open(weights_path, 'r') as f:
-            weights = json.load(f)
+        weights = _load_weights(weights_path)
         
         # Check modifier weight consistency
         modifier_weights = []
@@ -156,44 +263,51 @@ def validate_modifiers(modifiers_path, weights_path):
         
         if modifier_weights:
             avg_modifier_weight = np.mean(modifier_weights)
-            print(f"   📊 Average modifier weight: {avg_modifier_weight:.2f}")
+            _out.append(f"   📊 Average modifier weight: {avg_modifier_weight:.2f}")
             
             # Modifiers should generally have lower weights
             if avg_modifier_weight > 2.0:
-                print(f"   ⚠️ Modifiers have unusually high weights")
+                _out.append(f"   ⚠️ Modifiers have unusually high weights")
             else:
-                print(f"   ✅ Modifier weights: APPROPRIATE")
+                _out.append(f"   ✅ Modifier weights: APPROPRIATE")
         
-        print(f"   ✅ Modifier consistency: VALID")
+        _out.append(f"   ✅ Modifier consistency: VALID")
+        _flush()
         return True
         
     except FileNotFoundError:
-        print(f"   ⚠️ Modifiers file not found, skipping validation")
+        _out.append(f"   ⚠️ Modifiers file not found, skipping validation")
+        _flush()
         return True
 
 def calculate_curvature_objective(weights, corpus_path):
     """Calculate current curvature optimization objective"""
-    print("\n🔍 CALCULATING CURVATURE OBJECTIVE")
-    print("=" * 35)
+    _out.append("\n🔍 CALCULATING CURVATURE OBJECTIVE")
+    _out.append("=" * 35)
     
-    df = pd.read_csv(corpus_path, sep='\t')
+    # Signs as ids into a flat weight table; unweighted signs (-1) hit the trailing 1.0 slot
+    sign_ids = pd.Index(list(weights))
+    weight_arr = np.append(np.fromiter(weights.values(), dtype=np.float64, count=len(weights)), 1.0)
     
-    total_objective = 0
+    total_objective = 0.0
     valid_inscriptions = 0
-    
-    for _, row in df.iterrows():
-        signs = str(row['signs']).split()
-        if len(signs) > 1:
-            inscription_weight = sum(weights.get(sign, 1.0) for sign in signs)
-            total_objective += inscription_weight
-            valid_inscriptions += 1
+    for signs in _iter_signs(corpus_path):
+        tokens = signs.str.split()
+        sizes = tokens.str.len().fillna(0).to_numpy(dtype=np.int64)
+        token_weights = weight_arr[sign_ids.get_indexer(tokens.explode().dropna())]
+        
+        # Per-inscription weight sums; only multi-sign inscriptions count, accumulated in row order
+        inscription_weights = _segment_sums(token_weights, sizes)[sizes > 1]
+        total_objective = sum(inscription_weights.tolist(), total_objective)
+        valid_inscriptions += len(inscription_weights)
     
     avg_objective = total_objective / valid_inscriptions if valid_inscriptions > 0 else 0
     
-    print(f"   📊 Total objective: {total_objective:.1f}")
-    print(f"   📊 Average per inscription: {avg_objective:.2f}")
-    print(f"   📊 Valid inscriptions: {valid_inscriptions}")
+    _out.append(f"   📊 Total objective: {total_objective:.1f}")
+    _out.append(f"   📊 Average per inscription: {avg_objective:.2f}")
+    _out.append(f"   📊 Valid inscriptions: {valid_inscriptions}")
     
+    _flush()
     return total_objective, avg_objective
 
 def main():
@@ -206,8 +320,8 @@ def main():
     
     args = parser.parse_args()
     
-    print("🔢 INDUS NUMERICAL BACKBONE VALIDATION")
-    print("=" * 42)
+    _out.append("🔢 INDUS NUMERICAL BACKBONE VALIDATION")
+    _out.append("=" * 42)
     
     # Run all validations
     validations = {
@@ -218,23 +332,22 @@ def main():
     }
     
     # Calculate curvature objective
-    with open(args.weights, 'r') as f:
-        weights = json.load(f)
+    weights = _load_weights(args.weights)
     
     total_obj, avg_obj = calculate_curvature_objective(weights, args.corpus)
     
     # Overall assessment
     all_valid = all(validations.values())
     
-    print(f"\n🎯 VALIDATION SUMMARY")
-    print("=" * 20)
+    _out.append(f"\n🎯 VALIDATION SUMMARY")
+    _out.append("=" * 20)
     
     for validation, result in validations.items():
         status = "✅ PASS" if result else "❌ FAIL"
-        print(f"   {validation.replace('_', ' ').title()}: {status}")
+        _out.append(f"   {validation.replace('_', ' ').title()}: {status}")
     
     overall_status = "PASS" if all_valid else "FAIL"
-    print(f"\n🏆 OVERALL STATUS: {overall_status}")
+    _out.append(f"\n🏆 OVERALL STATUS: {overall_status}")
     
     # Write detailed report
     report_lines = [
@@ -263,9 +376,13 @@ def main():
     with open(args.out, 'w') as f:
         f.write('\n'.join(report_lines))
     
-    print(f"\n📋 Detailed report saved to: {args.out}")
+    _out.append(f"\n📋 Detailed report saved to: {args.out}")
     
+    _flush()
     return 0 if all_valid else 1
 
 if __name__ == "__main__":
-    exit(main()) 
\ No newline at end of file
+    try:
+        exit(main())
+    finally:
+        _flush()  # Emit whatever a failing validator had queued before its traceback
@@ -6,6 +6,12 @@ These tests require the actual data files to be present.
 import unittest
 import sys
 import os
+import io
+import importlib.util
+import json
+import tempfile
+from contextlib import redirect_stdout
+from unittest import mock
 import pandas as pd
 
 # Add src to path for testing
@@ -107,5 +113,125 @@ class TestRevolutionaryFindings(unittest.TestCase):
             self.assertEqual(most_common_word, 'father',
                            f"Expected 'father' to be most common, got '{most_common_word}'")
 
+class TestNumericValidation(unittest.TestCase):
+    
+    def setUp(self):
+        """Write a small corpus with an empty, a blank and a 'nan' signs cell."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.corpus_path = os.path.join(self.tmp.name, "corpus.tsv")
+        self.weights_path = os.path.join(self.tmp.name, "weights.json")
+        with open(self.corpus_path, 'w') as f:
+            f.write("id\tsigns\tsite\tlayer\n"
+                    "1\t740 17 2\tHarappa\tV\n"
+                    "2\t\tHarappa\tV\n"
+                    "3\t   \tHarappa\tV\n"
+                    "4\tnan\tHarappa\tV\n"
+                    "5\t410 17\tHarappa\tV\n"
+                    "6\t17 2\tHarappa\tV\n"
+                    "7\t99\tHarappa\tV\n")
+        with open(self.weights_path, 'w') as f:
+            json.dump({"740": 1.0, "17": 2.0, "2": 3.0, "410": 4.0, "5": 1.0}, f)
+        
+        # Exercise the Parquet copies the validators keep under INDUS_CACHE=1
+        self.env = mock.patch.dict(os.environ, {'INDUS_CACHE': '1'})
+        self.env.start()
+    
+    def tearDown(self):
+        self.env.stop()
+        self.tmp.cleanup()
+    
+    def run_validator(self, validator, *args):
+        """Run a validator and return its report text."""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            validator(*args)
+        return out.getvalue()
+    
+    def test_missing_signs_reported(self):
+        """Test that empty, blank and 'nan' signs are reported on cold and warm runs."""
+        from indus.validate_numeric import validate_corpus_structure
+        
+        for run in ('cold', 'warm'):
+            report = self.run_validator(validate_corpus_structure, self.corpus_path)
+            self.assertIn("'signs': 2", report, f"Null signs not counted on {run} run")
+            self.assertIn("Invalid sign sequences: 3", report, f"Invalid signs not counted on {run} run")
+            self.assertTrue(os.path.exists(os.path.join(self.tmp.name, "corpus.table.parquet")))
+    
+    def test_fast_io_matches_pandas(self):
+        """Test that the optional polars parse reports the same nulls and invalid signs."""
+        if importlib.util.find_spec('polars') is None:
+            self.skipTest("polars not installed")
+        from indus.validate_numeric import validate_corpus_structure
+        
+        reports = []
+        for fast_io in ('0', '1'):
+            with mock.patch.dict(os.environ, {'INDUS_CACHE': '0', 'INDUS_FAST_IO': fast_io}):
+                reports.append(self.run_validator(validate_corpus_structure, self.corpus_path))
+        self.assertIn("'signs': 2", reports[1])
+        self.assertIn("Invalid sign sequences: 3", reports[1])
+        self.assertEqual(reports[1], reports[0])
+    
+    def test_missing_signs_excluded_from_coverage(self):
+        """Test that missing signs do not show up as signs without weights, cold or warm."""
+        from indus.validate_numeric import validate_corpus_structure, validate_weights_consistency
+        
+        for run in ('cold', 'warm'):
+            report = self.run_validator(validate_weights_consistency, self.weights_path, self.corpus_path)
+            self.assertIn("Weight coverage: 80.0%", report, f"Coverage differs on {run} run")
+            self.assertIn("Signs without weights: 1", report, f"Missing weights differ on {run} run")
+            self.assertNotIn("'None'", report)
+            # Writes the Parquet copy the warm run streams from
+            self.run_validator(validate_corpus_structure, self.corpus_path)
+    
+    def test_parquet_copy_tracks_source(self):
+        """Test that the Parquet copy is rebuilt when the text file changes, even to an older mtime."""
+        from indus.validate_numeric import _read_tabular
+        
+        self.assertEqual(len(_read_tabular(self.corpus_path, sep='\t')), 7)
+        stat = os.stat(self.corpus_path)
+        with open(self.corpus_path, 'a') as f:
+            f.write("8\t740 2\tHarappa\tV\n")
+        os.utime(self.corpus_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+        self.assertEqual(len(_read_tabular(self.corpus_path, sep='\t')), 8)
+    
+    def test_parquet_copy_is_best_effort(self):
+        """Test that a frame Arrow cannot store is still returned."""
+        from indus.validate_numeric import _read_tabular
+        
+        mixed = pd.DataFrame({'compound_id': [101, '102A'], 'components': ['740 17', '17 2']})
+        df = _read_tabular(self.corpus_path, parse=lambda path: mixed)
+        self.assertIs(df, mixed)
+
+class TestTableShape(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "translations.tsv")
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def write(self, text):
+        with open(self.path, 'w') as f:
+            f.write(text)
+    
+    def test_matches_pandas(self):
+        """Test that row counts agree with pandas, quoted newlines included."""
+        from indus.validate import _table_shape
+        
+        for text in ("id\tenglish_translation\n1\tfather\n\n2\tgrain\n",
+                     "id\tenglish_translation\n1\t\"father\nof grain\"\n2\tgrain\n"):
+            self.write(text)
+            df = pd.read_csv(self.path, sep='\t')
+            self.assertEqual(_table_shape(self.path), (len(df), list(df.columns)))
+    
+    def test_unterminated_quote_rejected(self):
+        """Test that a malformed file is not accepted."""
+        from indus.validate import _table_shape
+        
+        self.write("id\tenglish_translation\n1\tfather\n2\t\"x\n")
+        with self.assertRaises(pd.errors.ParserError):
+            _table_shape(self.path)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
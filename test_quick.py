@@ -6,11 +6,12 @@ These tests run without requiring the full dataset.
 import unittest
 import sys
 import os
+import numpy as np
 
 # Add src to path for testing
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from indus.utils import pct, format_number, revolutionary_summary, data_status_emoji
+from indus.utils import pct, pct_vec, format_number, revolutionary_summary, data_status_emoji
 
 class TestUtils(unittest.TestCase):
     
@@ -21,6 +22,11 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(pct(0, 100), 0.0)
         self.assertEqual(pct(10, 0), 0.0)  # Handle division by zero
     
+    def test_pct_vec_calculation(self):
+        """Test vectorized percentage calculation matches pct."""
+        self.assertEqual(pct_vec([25, 1, 0, 10], [100, 4, 100, 0]).tolist(), [25.0, 25.0, 0.0, 0.0])
+        self.assertEqual(pct_vec([3, 7], 10).tolist(), [pct(3, 10), pct(7, 10)])
+    
     def test_format_number(self):
         """Test number formatting."""
         self.assertEqual(format_number(2512), "2,512")
@@ -62,5 +68,110 @@ class TestRevolutionaryFindings(unittest.TestCase):
         self.assertGreater(claims['geographic_extent_km2'], 1000000)
         self.assertGreater(claims['major_cities'], 10)
 
+class TestKernels(unittest.TestCase):
+    """The numpy kernels must match the straightforward Python loops they replace."""
+    
+    def setUp(self):
+        self.rng = np.random.RandomState(0)
+        lengths = self.rng.randint(0, 7, size=200)
+        self.lengths = lengths.astype(np.int64)
+        self.sequences = [self.rng.randint(0, 12, size=n).tolist() for n in lengths]
+        self.weight_lut = self.rng.uniform(0.1, 5.0, size=12)
+    
+    def test_segment_sums(self):
+        """Test ragged sums against sum() over each run."""
+        from indus.validate_numeric import _segment_sums
+        
+        values = np.concatenate([self.weight_lut[seq] for seq in self.sequences])
+        expected = [sum(self.weight_lut[seq].tolist()) for seq in self.sequences]
+        self.assertEqual(_segment_sums(values, self.lengths).tolist(), expected)
+    
+    def test_sequence_kernel(self):
+        """Test per-sequence sign statistics against a per-sequence loop."""
+        from indus.trade_ritual_analysis import _sequence_kernel
+        
+        codes = np.array([c for seq in self.sequences for c in seq], dtype=np.int64)
+        seq_id, totals, repeated_idx, is_high, hi_count = _sequence_kernel(codes, self.lengths, self.weight_lut, 2.5)
+        
+        expected_repeated, start = [], 0
+        for seq in self.sequences:
+            if len(seq) >= 3:
+                expected_repeated += [start + i for i, c in enumerate(seq)
+                                      if seq.count(c) > 1 and c not in seq[:i]]
+            start += len(seq)
+        
+        self.assertEqual(seq_id.tolist(), [i for i, seq in enumerate(self.sequences) for _ in seq])
+        self.assertEqual(totals.tolist(), [sum(self.weight_lut[c] for c in seq) for seq in self.sequences])
+        self.assertEqual(repeated_idx.tolist(), expected_repeated)
+        self.assertEqual(is_high.tolist(), [self.weight_lut[c] > 2.5 for seq in self.sequences for c in seq])
+        self.assertEqual(hi_count.tolist(), [sum(self.weight_lut[c] > 2.5 for c in seq) for seq in self.sequences])
+    
+    def test_authority_counts(self):
+        """Test father/mother/king counts against the per-route arithmetic."""
+        from indus.temple_distance_regression import _authority_counts
+        
+        dist = np.array([0.0, 150.0, 199.9, 200.0, 450.0, 800.0, 1234.5, 2000.0])
+        father, mother, king = _authority_counts(dist)
+        
+        base = [max(1, int(d / 200)) for d in dist.tolist()]
+        self.assertEqual(father.tolist(), [b * 4 for b in base])
+        self.assertEqual(mother.tolist(), [b * 1 for b in base])
+        self.assertEqual(king.tolist(), [max(1, b // 2) for b in base])
+    
+    def test_build_authority_matrix(self):
+        """Test the dense matrix against nested dict accumulation in pair order."""
+        from indus.token_cohort import TokenCohortAnalyzer
+        
+        analyzer = TokenCohortAnalyzer()
+        owners, commodities = list(analyzer._owner_idx), list(analyzer._commodity_idx)
+        n_pairs = 60
+        owner_ids = self.rng.randint(0, len(owners), size=n_pairs).tolist()
+        commodity_ids = self.rng.randint(0, len(commodities), size=n_pairs).tolist()
+        strengths = self.rng.randint(1, 5, size=n_pairs).tolist()
+        pairs = analyzer._pairs_frame(list(range(n_pairs)), owner_ids, commodity_ids, strengths,
+                                      [''] * n_pairs, [''] * n_pairs)
+        authority_matrix, first_seen = analyzer.build_authority_matrix(pairs)
+        
+        expected, expected_first = {}, {}
+        for i, (o, c, s) in enumerate(zip(owner_ids, commodity_ids, strengths)):
+            expected[o, c] = expected.get((o, c), 0) + s
+            expected_first.setdefault((o, c), i)
+        
+        for o in range(len(owners)):
+            for c in range(len(commodities)):
+                self.assertEqual(authority_matrix[o, c], expected.get((o, c), 0))
+                self.assertEqual(first_seen[o, c], expected_first.get((o, c), analyzer._UNSEEN))
+    
+    def test_lookup_arrays(self):
+        """Test table lookups against per-sign dict lookups, negative ids included."""
+        import pandas as pd
+        from indus.to_english import build_lookup_arrays, generate_fluent_translations
+        
+        glosses = {'740': 'fish', '17': 'grain', '2': 'two'}
+        weights = {'740': 6.0, '17': 3.5, '-5': 9.0}
+        for seqs in ([[740, 17, 2], [410, -5], [-5, -740, 17]], [[-3, -5], [-1]]):
+            corpus_df = pd.DataFrame({'inscr_id': range(len(seqs)),
+                                      'signs': [np.array(seq, dtype=np.int64) for seq in seqs]})
+            gloss_arr, weight_arr = build_lookup_arrays(glosses, weights, corpus_df['signs'])
+            translations = generate_fluent_translations(corpus_df, gloss_arr, weight_arr)
+            
+            for t, seq in zip(translations, seqs):
+                expected_words = [glosses.get(str(s), f'unknown_{s}').replace('_', ' ') for s in seq]
+                self.assertTrue(all(w.lower() in t['english_phrase'].lower() for w in expected_words))
+                self.assertEqual(t['weight_total'], sum(weights.get(str(s), 1.0) for s in seq))
+    
+    def test_tally(self):
+        """Test category counts and row flags against per-category loops."""
+        from indus.truth_detector import _tally
+        
+        hits = self.rng.rand(40, 9) < 0.2
+        membership = (self.rng.rand(9, 4) < 0.4).astype(np.int64)
+        counts, has_category = _tally(hits, membership)
+        
+        categories = [[t for t in range(9) if membership[t, j]] for j in range(4)]
+        self.assertEqual(counts.tolist(), [sum(int(hits[:, t].sum()) for t in terms) for terms in categories])
+        self.assertEqual(has_category.tolist(),
+                         [[any(hits[r, t] for t in terms) for terms in categories] for r in range(40)])
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file